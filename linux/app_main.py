@@ -23,6 +23,7 @@ from pathlib import Path
 from PyQt5.QtWidgets import QApplication
 
 from ui.ui_app import SignLanguageTranslatorApp
+from engine.inference import load_inference_model
 
 
 
@@ -30,8 +31,8 @@ def main():
     try:
         # models 폴더 경로 설정
         models_dir = Path("models")
-        # 훈련된 모델과 인코더 불러오기
-        trained_model = joblib.load(models_dir / "train_model.pkl")
+        # 훈련된 모델과 인코더 불러오기 (모델은 단일 샘플 추론 모드로 설정)
+        trained_model = load_inference_model(models_dir / "train_model.pkl")
         label_encoder = joblib.load(models_dir / "encoder.pkl")
         print("===== 모델 및 인코더 로드 완료 =====")
     except FileNotFoundError:
@@ -9,6 +9,7 @@ MODELS_DIR= os.path.join(BASE_DIR, 'models')
 
 #개별 파일 경로
 DATASET_FILE = os.path.join(DATA_DIR, 'combine_4.csv') # 수집한 데이터셋 파일
+DATASET_BIN_DIR = os.path.join(DATA_DIR, 'combine_4') # 바이너리 변환된 데이터셋 (python -m engine.dataset 으로 생성)
 HELP_IMG = os.path.join(DATA_DIR,'hand_img.png') # 도움말 이미지
 ICON_IMG = os.path.join(DATA_DIR,'세종머왕.png') # 앱 아이콘
 FONT_PATH = os.path.join(DATA_DIR, 'GowunDodum-Regular.ttf')
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+손 구성(왼손만 / 오른손만 / 두 손)별 분류기 캐스케이드 모듈.
+- 자음은 한 손, 모음은 두 손으로 표현하므로, 감지된 손 구성으로 먼저 나눈 뒤
+  해당 구성의 레이블만 학습한 작은 모델이 필요한 특징 구간만 보고 분류합니다.
+- 한 손 모델은 그 손의 85개 특징만, 두 손 모델은 170개 특징 전체를 사용합니다.
+- 전체 레이블 기준 predict / predict_proba / classes_ 를 제공하므로 단일 모델 자리에 그대로 저장/사용할 수 있습니다.
+"""
+import numpy as np
+
+from engine.features import hand_feature_index, hand_presence
+
+# 손 구성 이름 (route_ids 의 값 0, 1, 2 순서)
+ROUTES = ('left', 'right', 'both')
+# 구성별 모델 입력 특징 열 (None: 전체 170개)
+ROUTE_FEATURES = {'left': hand_feature_index(0), 'right': hand_feature_index(1), 'both': None}
+
+
+def route_ids(X: np.ndarray) -> np.ndarray:
+    """특징 행렬 (N, 170)의 행별 손 구성 번호 (0=왼손만, 1=오른손만, 2=두 손, -1=손 없음)"""
+    present = hand_presence(X)
+    return present[:, 0] + 2 * present[:, 1].astype(np.int64) - 1
+
+
+def route_features(X: np.ndarray, route: str) -> np.ndarray:
+    """손 구성 모델에 넣을 특징 구간"""
+    index = ROUTE_FEATURES[route]
+    return X if index is None else X[:, index]
+
+
+class HandCascade:
+    """
+    손 구성별 하위 모델 묶음.
+    - models: 손 구성 이름 -> route_features(X, 구성) 로 학습한 모델
+    - 학습 데이터에 없던 손 구성이 들어오면 그 행의 확률은 모두 0입니다.
+    """
+    def __init__(self, models: dict, classes):
+        """
+        Args:
+            models (dict)  : {'left' | 'right' | 'both': 학습된 모델}
+            classes        : 전체 클래스 배열 (각 하위 모델의 classes_ 를 모두 포함, 정렬됨)
+            self._columns  : 구성별 하위 모델 확률 열 -> 전체 확률 열 위치
+        """
+        self.models = models
+        self.classes_ = np.asarray(classes)
+        self._columns = {route: np.searchsorted(self.classes_, model.classes_)
+                         for route, model in models.items()}
+
+    @classmethod
+    def fit(cls, X: np.ndarray, y: np.ndarray, make_model):
+        """
+        손 구성별로 데이터를 나눠 make_model() 로 만든 모델을 학습.
+        손이 없는 행과 샘플이 없는 구성은 건너뜁니다.
+        """
+        routes = route_ids(X)
+        models = {}
+        for r, route in enumerate(ROUTES):
+            rows = routes == r
+            if not rows.any():
+                continue
+            model = make_model()
+            model.fit(route_features(X[rows], route), y[rows])
+            models[route] = model
+        return cls(models, np.unique(y))
+
+    def flatten(self):
+        """하위 모델을 평탄화(FlatForest)한 캐스케이드 사본 반환 (평탄화할 수 없는 모델은 그대로 사용)"""
+        from engine.flat_forest import flatten_model
+        return HandCascade({route: flatten_model(model) or model for route, model in self.models.items()},
+                           self.classes_)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """(N, 전체 클래스 수) 확률 반환 (행마다 해당 손 구성 모델의 확률을 전체 열 위치에 배치)"""
+        X = np.asarray(X)
+        proba = np.zeros((X.shape[0], len(self.classes_)))
+        routes = route_ids(X)
+        if X.shape[0] == 1:
+            # 실시간 한 행 예측: 행 선택 없이 해당 구성 모델만 호출
+            r = int(routes[0])
+            route = ROUTES[r] if r >= 0 else None
+            if route in self.models:
+                proba[0, self._columns[route]] = self.models[route].predict_proba(route_features(X, route))[0]
+            return proba
+        for r, route in enumerate(ROUTES):
+            rows = np.flatnonzero(routes == r)
+            if rows.size and route in self.models:
+                sub = self.models[route].predict_proba(route_features(X[rows], route))
+                proba[np.ix_(rows, self._columns[route])] = sub
+        return proba
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """전체 클래스 기준 예측 클래스 배열 반환"""
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
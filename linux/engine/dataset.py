@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""수집 데이터셋(CSV: label, lh_0_x … rh_20_z / 바이너리 디렉터리) 로드 모듈"""
+import hashlib
+import json
+import os
+from itertools import islice
+
+import numpy as np
+
+from engine.features import FEATURE_DTYPE
+
+# 두 손 x 21개 랜드마크 x (x, y, z)
+NUM_LANDMARK_COLS = 126
+# 한 번에 파싱할 행 수 (메모리 사용량 상한)
+DEFAULT_CHUNK_ROWS = 20000
+
+
+def _count_lines(dataset_file) -> int:
+    """바이트 단위로 줄 수를 세어 결과 배열 크기 상한을 구함 (파싱 없음)"""
+    with open(dataset_file, 'rb') as f:
+        return sum(block.count(b'\n') for block in iter(lambda: f.read(1 << 20), b'')) + 1
+
+def _iter_chunks(f, chunk_rows: int):
+    """빈 줄을 제외하고 최대 chunk_rows 줄씩 묶어서 반환"""
+    while True:
+        lines = list(islice(f, chunk_rows))
+        if not lines:
+            return
+        lines = [line for line in lines if line.strip()]
+        if lines:
+            yield lines
+
+def load_landmark_csv(dataset_file, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+    """
+    CSV 데이터셋을 한 번만 읽어 라벨과 랜드마크 행렬을 함께 반환.
+    - 파일을 chunk_rows 줄씩 스트리밍하며 미리 할당한 float32 행렬에 바로 채우므로,
+      메모리 사용량은 결과 행렬 + 청크 하나 수준으로 유지됩니다.
+
+    반환: (labels: (N,) str 배열, landmarks: (N, 126) float32 행렬)
+    """
+    landmarks = np.empty((_count_lines(dataset_file), NUM_LANDMARK_COLS), dtype=FEATURE_DTYPE)
+    labels = []
+    n = 0
+    with open(dataset_file, encoding="UTF-8") as f:
+        next(f, None)  # 헤더 건너뛰기
+        for lines in _iter_chunks(f, chunk_rows):
+            rows = len(lines)
+            landmarks[n:n + rows] = np.loadtxt(lines, delimiter=',', usecols=range(1, NUM_LANDMARK_COLS + 1),
+                                               dtype=FEATURE_DTYPE, ndmin=2)
+            labels.extend(line.split(',', 1)[0] for line in lines)
+            n += rows
+    return np.array(labels, dtype=str), landmarks[:n]
+
+
+# ===== 바이너리(컬럼형) 데이터셋 =====
+# 디렉터리 하나에 컬럼별 .npy 파일로 저장 -> np.load(mmap_mode='r') 로 즉시 로드
+LANDMARKS_NPY = 'landmarks.npy'      # (N, 126) float32
+LABELS_NPY = 'labels.npy'            # (N,) int16 (label_table 인덱스)
+LABEL_TABLE_NPY = 'label_table.npy'  # (K,) str
+SOURCE_JSON = 'source.json'          # 변환한 원본 CSV 경로/크기/수정 시각/SHA-256 (갱신 여부 확인용)
+
+
+def _file_sha256(path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def convert_csv_to_binary(csv_file, out_dir, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+    """
+    수집 CSV(label, lh_0_x … rh_20_z)를 바이너리 데이터셋 디렉터리로 변환.
+    반환: 저장된 샘플 수
+    """
+    # 읽기 전에 기록 -> 변환 중에 CSV 가 바뀌면 다음 확인 때 수정 시각이 달라 SHA-256 비교로 넘어감
+    stat = os.stat(csv_file)
+    labels_str, landmarks = load_landmark_csv(csv_file, chunk_rows)
+    label_table, labels = np.unique(labels_str, return_inverse=True)
+    os.makedirs(out_dir, exist_ok=True)
+    np.save(os.path.join(out_dir, LANDMARKS_NPY), np.ascontiguousarray(landmarks))
+    np.save(os.path.join(out_dir, LABELS_NPY), labels.astype(np.int16))
+    np.save(os.path.join(out_dir, LABEL_TABLE_NPY), label_table)
+    with open(os.path.join(out_dir, SOURCE_JSON), 'w', encoding='utf-8') as f:
+        json.dump({'path': os.path.abspath(csv_file), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                   'sha256': _file_sha256(csv_file)}, f)
+    return len(labels)
+
+def load_landmark_binary(dataset_dir):
+    """
+    바이너리 데이터셋 디렉터리를 메모리 매핑으로 로드.
+    반환: (labels: (N,) int16 memmap, label_table: (K,) str 배열, landmarks: (N, 126) float32 memmap)
+    """
+    landmarks = np.load(os.path.join(dataset_dir, LANDMARKS_NPY), mmap_mode='r')
+    labels = np.load(os.path.join(dataset_dir, LABELS_NPY), mmap_mode='r')
+    label_table = np.load(os.path.join(dataset_dir, LABEL_TABLE_NPY))
+    return labels, label_table, landmarks
+
+def is_binary_dataset(path) -> bool:
+    """path 가 바이너리 데이터셋 디렉터리인지 여부"""
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, LANDMARKS_NPY))
+
+def is_binary_dataset_current(dataset_dir) -> bool:
+    """
+    바이너리 데이터셋이 변환한 원본 CSV 와 아직 같은지 여부 (source.json 에 기록한 원본 정보와 비교).
+    - 크기와 수정 시각이 같으면 파일을 읽지 않고 True, 크기가 다르면 False
+    - 크기는 같고 수정 시각만 다르면(복사/touch 등) SHA-256 을 계산해 비교
+    - 원본 정보가 없거나(이전 버전으로 변환) 원본 CSV 가 바뀌었으면 False
+    - 원본 CSV 가 없어 비교할 수 없으면 True
+    """
+    try:
+        with open(os.path.join(dataset_dir, SOURCE_JSON), encoding='utf-8') as f:
+            source = json.load(f)
+    except (OSError, ValueError):
+        return False
+    try:
+        stat = os.stat(source['path'])
+    except OSError:
+        return True
+    if stat.st_size != source['size']:
+        return False
+    if stat.st_mtime_ns == source.get('mtime_ns'):
+        return True
+    return _file_sha256(source['path']) == source['sha256']
+
+def load_landmark_dataset(path):
+    """
+    CSV 파일 / 바이너리 데이터셋 디렉터리 모두 지원하는 로더.
+    반환: (labels: (N,) int 배열 (label_table 인덱스), label_table: (K,) 정렬된 str 배열,
+           landmarks: (N, 126) float32 행렬)
+    """
+    if is_binary_dataset(path):
+        labels, label_table, landmarks = load_landmark_binary(path)
+        return np.asarray(labels, dtype=np.intp), label_table, landmarks
+    labels_str, landmarks = load_landmark_csv(path)
+    label_table, labels = np.unique(labels_str, return_inverse=True)
+    return labels, label_table, landmarks
+
+
+if __name__ == "__main__":
+    # CSV -> 바이너리 변환 (실행: python -m engine.dataset <csv 파일> <출력 디렉터리>)
+    import sys
+    if len(sys.argv) != 3:
+        print("사용법: python -m engine.dataset <csv 파일> <출력 디렉터리>")
+        sys.exit(1)
+    count = convert_csv_to_binary(sys.argv[1], sys.argv[2])
+    print(f"변환 완료: {count}개 샘플 -> {sys.argv[2]}")
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+학습된 RandomForest/ExtraTrees 를 평탄화된 노드 배열로 변환해 NumPy 만으로 예측하는 모듈.
+- sklearn 의 입력 검증/추정기 호출/병렬 디스패치 없이 모든 트리를 한 번에 순회합니다.
+- 예측 결과는 model.predict / model.predict_proba 와 동일합니다.
+"""
+import numpy as np
+
+from engine.features import FEATURE_DTYPE
+
+
+class FlatForest:
+    """
+    모든 트리의 노드를 하나의 연속 배열로 이어 붙인 포레스트 예측기.
+    - feature / threshold / children / missing_left : 노드별 분기 정보
+    - 리프 노드는 자기 자신을 자식으로 가리키므로 최대 깊이만큼 반복하면 모든 트리가 리프에 도달합니다.
+    - leaf_row 로 리프 노드 -> leaf_proba(리프별 클래스 확률) 행을 찾습니다.
+    """
+    def __init__(self, feature, threshold, children, missing_left, leaf_row, leaf_proba,
+                 roots, max_depth, classes):
+        self.feature = feature            # (노드 수,) int32
+        self.threshold = threshold        # (노드 수,) float64
+        self.children = children          # (노드 수, 2) int32 [왼쪽, 오른쪽]
+        self.missing_left = missing_left  # (노드 수,) bool (NaN 입력 시 왼쪽으로 이동 여부)
+        self.leaf_row = leaf_row          # (노드 수,) int32 (리프가 아니면 -1)
+        self.leaf_proba = leaf_proba      # (리프 수, 클래스 수) float64
+        self.roots = roots                # (트리 수,) int32 각 트리의 루트 노드
+        self.max_depth = max_depth
+        self.classes_ = classes
+        self.n_trees = len(roots)
+
+    @classmethod
+    def from_model(cls, model):
+        """
+        학습된 RandomForestClassifier / ExtraTreesClassifier 에서 생성.
+        지원하지 않는 모델이면 ValueError.
+        """
+        estimators = getattr(model, 'estimators_', None)
+        if not estimators or getattr(model, 'n_outputs_', 1) != 1:
+            raise ValueError(f"평탄화할 수 없는 모델입니다: {type(model).__name__}")
+
+        features, thresholds, children, missing_left, leaf_rows, leaf_probas, roots = [], [], [], [], [], [], []
+        offset, n_leaves, max_depth = 0, 0, 0
+        n_classes = len(model.classes_)
+        for est in estimators:
+            tree = getattr(est, 'tree_', None)
+            if tree is None or tree.n_outputs != 1 or tree.value.shape[2] != n_classes:
+                raise ValueError(f"평탄화할 수 없는 트리입니다: {type(est).__name__}")
+            n_nodes = tree.node_count
+            node_ids = np.arange(n_nodes)
+            is_leaf = tree.children_left == -1
+
+            left = np.where(is_leaf, node_ids, tree.children_left) + offset
+            right = np.where(is_leaf, node_ids, tree.children_right) + offset
+            children.append(np.stack([left, right], axis=1))
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(tree.threshold)
+            missing = getattr(tree, 'missing_go_to_left', None)
+            missing_left.append(np.zeros(n_nodes, dtype=bool) if missing is None else missing.astype(bool))
+
+            # DecisionTreeClassifier.predict_proba 와 동일한 정규화
+            proba = tree.value[is_leaf, 0, :]
+            normalizer = proba.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            leaf_probas.append(proba / normalizer)
+            rows = np.full(n_nodes, -1, dtype=np.int64)
+            rows[is_leaf] = np.arange(n_leaves, n_leaves + is_leaf.sum())
+            leaf_rows.append(rows)
+
+            roots.append(offset)
+            offset += n_nodes
+            n_leaves += int(is_leaf.sum())
+            max_depth = max(max_depth, tree.max_depth)
+
+        return cls(feature=np.concatenate(features).astype(np.int32),
+                   threshold=np.concatenate(thresholds).astype(np.float64),
+                   children=np.concatenate(children).astype(np.int32),
+                   missing_left=np.concatenate(missing_left),
+                   leaf_row=np.concatenate(leaf_rows).astype(np.int32),
+                   leaf_proba=np.concatenate(leaf_probas),
+                   roots=np.array(roots, dtype=np.int32),
+                   max_depth=max_depth,
+                   classes=np.asarray(model.classes_))
+
+    def apply(self, X: np.ndarray) -> np.ndarray:
+        """각 샘플이 도달하는 트리별 리프 노드 (N, 트리 수) 반환"""
+        X = np.asarray(X, dtype=FEATURE_DTYPE)
+        node = np.broadcast_to(self.roots, (X.shape[0], self.n_trees))
+        for _ in range(self.max_depth):
+            feature = self.feature[node]
+            value = np.take_along_axis(X, feature, axis=1)
+            go_left = value <= self.threshold[node]
+            nan_mask = np.isnan(value)
+            if nan_mask.any():
+                go_left = np.where(nan_mask, self.missing_left[node], go_left)
+            node = self.children[node, (~go_left).view(np.int8)]
+            if (self.leaf_row[node] >= 0).all():
+                break
+        return node
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """(N, 클래스 수) 확률 반환 (트리별 확률을 트리 순서대로 더한 뒤 트리 수로 나눔)"""
+        proba = self.leaf_proba[self.leaf_row[self.apply(X)]]  # (N, 트리 수, 클래스 수)
+        proba = np.add.reduce(proba, axis=1)
+        proba /= self.n_trees
+        return proba
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """model.predict 와 동일한 클래스 배열 반환"""
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
+
+
+def flatten_model(model):
+    """
+    평탄화 가능한 모델이면 FlatForest, 아니면 None 반환.
+    flatten() 을 가진 모델(HandCascade)은 하위 모델을 평탄화한 사본을 반환합니다.
+    """
+    flatten = getattr(model, 'flatten', None)
+    if callable(flatten):
+        return flatten()
+    try:
+        return FlatForest.from_model(model)
+    except (ValueError, AttributeError):
+        return None
+
+
+if __name__ == "__main__":
+    # 검증 + 지연 시간 비교 (실행: python -m engine.flat_forest [모델 파일] [데이터셋 경로])
+    import sys
+    from pathlib import Path
+
+    import joblib
+
+    from engine.inference import benchmark_predict, set_single_sample_mode, model_feature_index
+
+    model_path = sys.argv[1] if len(sys.argv) > 1 else Path("models") / "train_model.pkl"
+    model = set_single_sample_mode(joblib.load(model_path))
+    flat = FlatForest.from_model(model)
+    print(f"트리 {flat.n_trees}개, 노드 {len(flat.feature)}개, 최대 깊이 {flat.max_depth}")
+    if len(sys.argv) > 2:
+        from models.train_rf import load_and_preprocess
+        X, _, _ = load_and_preprocess(sys.argv[2])
+        if model_feature_index(model) is not None:
+            X = X[:, model_feature_index(model)]
+        same = np.array_equal(model.predict(X), flat.predict(X))
+        print(f"model.predict 와 일치: {same}")
+    before = benchmark_predict(model)
+    print("sklearn predict : 평균 {mean:.3f} ms, p50 {p50:.3f} ms, p99 {p99:.3f} ms".format(**before))
+    after = benchmark_predict(flat)
+    print("FlatForest      : 평균 {mean:.3f} ms, p50 {p50:.3f} ms, p99 {p99:.3f} ms".format(**after))
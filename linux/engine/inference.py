@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""실시간(프레임 단위) 추론용 모델 로드/설정 모듈"""
+import time
+
+import joblib
+import numpy as np
+
+from engine.features import NUM_FEATURES, FEATURE_DTYPE
+
+
+def set_n_jobs(model, n_jobs: int):
+    """
+    중첩된 추정기(Pipeline 등)를 포함해 병렬 처리가 켜진 n_jobs 파라미터를 n_jobs 로 바꿈 (제자리 변경).
+    - 값이 None/1 인 파라미터(병렬 처리 안 함)는 그대로 둡니다.
+      (예: LogisticRegression 은 n_jobs 를 지정하면 사용하지 않는 파라미터라며 FutureWarning 을 냄)
+    """
+    try:
+        params = {key: n_jobs for key, value in model.get_params().items()
+                  if (key == 'n_jobs' or key.endswith('__n_jobs')) and value not in (None, 1)}
+    except AttributeError:
+        return model
+    if params:
+        model.set_params(**params)
+    return model
+
+def set_single_sample_mode(model):
+    """
+    한 샘플씩 예측하는 용도로 모델 설정.
+    - n_jobs=-1 인 모델은 predict 마다 joblib 병렬 디스패치를 거치는데,
+      (1, 170) 한 행 예측에서는 스레드 풀 오버헤드가 실제 트리 연산보다 큽니다.
+    - 중첩된 추정기(Pipeline 등)를 포함해 병렬 처리가 켜진 n_jobs 파라미터를 1로 바꿉니다.
+    """
+    return set_n_jobs(model, 1)
+
+def model_feature_index(model):
+    """
+    특징 선택으로 학습한 모델의 입력 특징 열 인덱스 (170개 중 선택된 열, 오름차순).
+    특징 선택 없이 170개 전체로 학습한 모델이면 None.
+    """
+    return getattr(model, 'feature_index_', None)
+
+def load_inference_model(model_path):
+    """모델 파일을 불러와 단일 샘플 추론 모드로 설정해 반환"""
+    return set_single_sample_mode(joblib.load(model_path))
+
+def benchmark_predict(model, repeats: int = 300, warmup: int = 20, x: np.ndarray = None) -> dict:
+    """
+    단일 행 predict 지연 시간 측정 (ms). 반환: {'mean', 'p50', 'p99'}
+    x 를 주지 않으면 모델 입력 크기(기본 170)의 (1, n) 난수 입력 사용.
+    """
+    if x is None:
+        n_features = getattr(model, 'n_features_in_', NUM_FEATURES)
+        x = np.random.default_rng(0).random((1, n_features), dtype=FEATURE_DTYPE)
+    for _ in range(warmup):
+        model.predict(x)
+    times = np.empty(repeats)
+    for i in range(repeats):
+        start = time.perf_counter()
+        model.predict(x)
+        times[i] = time.perf_counter() - start
+    times *= 1000
+    return {'mean': float(times.mean()),
+            'p50': float(np.percentile(times, 50)),
+            'p99': float(np.percentile(times, 99))}
+
+
+if __name__ == "__main__":
+    # 지연 시간 벤치마크: 병렬 예측(n_jobs=-1) vs 단일 샘플 모드(n_jobs=1)
+    # 저장된 모델은 이미 단일 샘플 모드일 수 있으므로 두 설정 모두 복사본에 명시적으로 지정해 비교
+    # (실행: python -m engine.inference [모델 파일 경로])
+    import copy
+    import sys
+    from pathlib import Path
+
+    model_path = sys.argv[1] if len(sys.argv) > 1 else Path("models") / "train_model.pkl"
+    model = joblib.load(model_path)
+    print(f"모델: {model_path} (저장된 n_jobs={getattr(model, 'n_jobs', None)})")
+    before = benchmark_predict(set_n_jobs(copy.deepcopy(model), -1))
+    print("n_jobs=-1     : 평균 {mean:.3f} ms, p50 {p50:.3f} ms, p99 {p99:.3f} ms".format(**before))
+    after = benchmark_predict(set_single_sample_mode(copy.deepcopy(model)))
+    print("단일 샘플 모드: 평균 {mean:.3f} ms, p50 {p50:.3f} ms, p99 {p99:.3f} ms".format(**after))
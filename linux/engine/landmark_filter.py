@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""랜드마크 시간 필터 (One-Euro) 모듈: 특징 추출 전 랜드마크 떨림 제거"""
+import math
+
+import numpy as np
+
+from engine.features import FEATURE_DTYPE
+
+
+def _alpha(cutoff, dt: float):
+    """저역 통과 필터 계수 (cutoff: Hz, 스칼라 또는 배열)"""
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class LandmarkFilter:
+    """
+    두 손 (2, 21, 3) 랜드마크에 대한 One-Euro 필터.
+    - 21 x 3 좌표 전체를 한 번에 계산하며, 상태는 손(왼손/오른손)별로 유지합니다.
+    - 손이 사라지면 그 손의 트랙을 초기화하고, 다시 나타난 첫 프레임은 원본 값을 그대로 사용합니다.
+    - 천천히 움직일 때는 강하게 평활하고(떨림 제거), 빠르게 움직일 때는 cutoff 를 올려 지연을 줄입니다.
+    """
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 20.0, d_cutoff: float = 1.0):
+        """
+        Args:
+            min_cutoff (float) : 정지 상태의 최소 cutoff 주파수(Hz). 낮을수록 떨림이 줄고 지연이 늘어남
+            beta (float)       : 속도에 따른 cutoff 증가량. 클수록 빠른 움직임에 지연이 줄어듦
+            d_cutoff (float)   : 속도 추정용 cutoff 주파수(Hz)
+            self.output        : 필터링 결과 (2, 21, 3) 버퍼
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.output = np.zeros((2, 21, 3), dtype=FEATURE_DTYPE)
+        self._dx = np.zeros((2, 21, 3), dtype=FEATURE_DTYPE)
+        self._tmp = np.zeros((21, 3), dtype=FEATURE_DTYPE)
+        self._active = np.zeros(2, dtype=bool)
+        self._prev_time = np.zeros(2)
+
+    def reset(self, hand: int = None):
+        """트랙 초기화 (hand 를 주지 않으면 두 손 모두)"""
+        if hand is None:
+            self._active[:] = False
+        else:
+            self._active[hand] = False
+
+    def apply(self, landmarks: np.ndarray, present: np.ndarray, now: float) -> np.ndarray:
+        """
+        현재 프레임 랜드마크를 필터링해 self.output 에 기록하고 반환.
+        감지되지 않은 손은 트랙을 초기화하고 0 으로 둡니다.
+        """
+        for hand in (0, 1):
+            x, x_hat, dx_hat = landmarks[hand], self.output[hand], self._dx[hand]
+            if not present[hand]:
+                self._active[hand] = False
+                x_hat.fill(0)
+                continue
+            if not self._active[hand]:
+                np.copyto(x_hat, x)
+                dx_hat.fill(0)
+                self._active[hand] = True
+                self._prev_time[hand] = now
+                continue
+
+            dt = max(now - self._prev_time[hand], 1e-3)
+            self._prev_time[hand] = now
+            # 속도 추정 및 평활: dx_hat += a_d * ((x - x_hat) / dt - dx_hat)
+            tmp = self._tmp
+            np.subtract(x, x_hat, out=tmp)
+            tmp /= dt
+            tmp -= dx_hat
+            tmp *= _alpha(self.d_cutoff, dt)
+            dx_hat += tmp
+            # 속도에 따른 좌표별 cutoff 로 평활: x_hat += a * (x - x_hat)
+            np.abs(dx_hat, out=tmp)
+            tmp *= self.beta
+            tmp += self.min_cutoff
+            a = _alpha(tmp, dt)
+            np.subtract(x, x_hat, out=tmp)
+            tmp *= a
+            x_hat += tmp
+        return self.output
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+인식 결과 안정화 모듈.
+매 프레임 분류기 확률 벡터를 받아, 같은 레이블이 충분히 안정적으로 나오면 확정 후보(클래스 인덱스)를 반환합니다.
+쿨다운 등 실제 확정 여부는 GestureRecognizer 가 판단하고, 확정되면 reset() 을 호출합니다.
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import numpy as np
+
+
+class Stabilizer(ABC):
+    """
+    안정화기 인터페이스.
+    - 하위 클래스는 __init__ 에서 self.run (현재 후보 클래스의 연속 프레임 수, 확정 로그/HUD 용)을 0으로 설정합니다.
+    """
+    @abstractmethod
+    def update(self, proba: np.ndarray) -> Optional[int]:
+        """
+        한 프레임의 클래스 확률 벡터 (클래스 수,)를 반영.
+        반환: 확정 후보 클래스 인덱스 (아직 불안정하면 None)
+        """
+
+    @abstractmethod
+    def reset(self):
+        """확정 후 상태 초기화"""
+
+
+class RunLengthStabilizer(Stabilizer):
+    """
+    최근 N 프레임 연속 동일 판정 시 확정 (기존 history deque + set 비교와 같은 동작).
+    마지막 클래스와 연속 횟수만 유지하므로 프레임당 O(1).
+    """
+    def __init__(self, history_len: int):
+        self.history_len = history_len
+        self.last_id = None
+        self.run = 0
+
+    def update(self, proba: np.ndarray) -> Optional[int]:
+        class_id = int(proba.argmax())
+        if class_id == self.last_id:
+            self.run += 1
+        else:
+            self.last_id, self.run = class_id, 1
+        return class_id if self.run >= self.history_len else None
+
+    def reset(self):
+        self.last_id = None
+        self.run = 0
+
+
+class EmaStabilizer(Stabilizer):
+    """
+    확률 벡터의 지수이동평균(EMA) + 마진 기반 확정.
+    - 평균 확률 1위와 2위의 차이가 margin 이상이고 1위가 min_frames 프레임 연속 유지되면 바로 확정합니다.
+    - 확신이 낮은 경우에도 max_frames 프레임 연속 유지되면 확정합니다 (RunLengthStabilizer 와 같은 상한).
+    """
+    def __init__(self, max_frames: int, alpha: float = 0.5, margin: float = 0.4, min_frames: int = 2):
+        """
+        Args:
+            max_frames (int)  : 마진과 관계없이 확정하는 연속 프레임 수 (REC_HISTORY_LEN)
+            alpha (float)     : EMA 가중치 (클수록 최신 프레임 비중이 큼)
+            margin (float)    : 확정에 필요한 평균 확률 1위 - 2위 차이
+            min_frames (int)  : 마진을 만족해도 최소로 필요한 연속 프레임 수
+        """
+        self.max_frames = max_frames
+        self.alpha = alpha
+        self.margin = margin
+        self.min_frames = min(min_frames, max_frames)
+        self._ema = None
+        self._scratch = None
+        self.last_id = None
+        self.run = 0
+
+    def update(self, proba: np.ndarray) -> Optional[int]:
+        if self._ema is None or self._ema.shape != proba.shape:
+            self._ema = np.array(proba, dtype=np.float64)
+            self._scratch = np.empty_like(self._ema)
+        else:
+            # ema = alpha * proba + (1 - alpha) * ema (제자리 연산)
+            self._ema *= 1.0 - self.alpha
+            self._ema += self.alpha * proba
+
+        class_id = int(self._ema.argmax())
+        if class_id == self.last_id:
+            self.run += 1
+        else:
+            self.last_id, self.run = class_id, 1
+
+        if self.run >= self.max_frames:
+            return class_id
+        if self.run >= self.min_frames:
+            np.copyto(self._scratch, self._ema)
+            self._scratch[class_id] = -1.0
+            if self._ema[class_id] - self._scratch.max() >= self.margin:
+                return class_id
+        return None
+
+    def reset(self):
+        self._ema = None
+        self.last_id = None
+        self.run = 0
+
+
+class AdaptiveStabilizer(Stabilizer):
+    """
+    프레임별 확신도에 따라 필요한 연속 프레임 수를 조절하는 안정화기.
+    - 현재 연속 구간의 평균 확신도(1위 확률)가 conf_high 이상이면 min_frames, conf_low 이하이면 max_frames,
+      그 사이는 선형 보간한 프레임 수만큼 연속되면 확정합니다.
+    - 연속 횟수와 확신도 합만 유지하므로 프레임당 O(1).
+    """
+    def __init__(self, min_frames: int, max_frames: int, conf_low: float = 0.5, conf_high: float = 0.9):
+        """
+        Args:
+            min_frames (int)  : 확신도가 높을 때 필요한 최소 연속 프레임 수 (하한)
+            max_frames (int)  : 확신도가 낮을 때 필요한 연속 프레임 수 (상한)
+            conf_low (float)  : 이 이하 평균 확신도는 max_frames 적용
+            conf_high (float) : 이 이상 평균 확신도는 min_frames 적용
+        """
+        self.min_frames = min(min_frames, max_frames)
+        self.max_frames = max_frames
+        self.conf_low = conf_low
+        self.conf_high = conf_high
+        self.last_id = None
+        self.run = 0
+        self._conf_sum = 0.0
+
+    def required_frames(self, confidence: float) -> int:
+        """평균 확신도에 대해 필요한 연속 프레임 수"""
+        span = self.conf_high - self.conf_low
+        ratio = 1.0 if span <= 0 else (confidence - self.conf_low) / span
+        ratio = min(max(ratio, 0.0), 1.0)
+        return int(np.ceil(self.max_frames - (self.max_frames - self.min_frames) * ratio))
+
+    def update(self, proba: np.ndarray) -> Optional[int]:
+        class_id = int(proba.argmax())
+        confidence = float(proba[class_id])
+        if class_id == self.last_id:
+            self.run += 1
+            self._conf_sum += confidence
+        else:
+            self.last_id, self.run, self._conf_sum = class_id, 1, confidence
+        if self.run >= self.required_frames(self._conf_sum / self.run):
+            return class_id
+        return None
+
+    def reset(self):
+        self.last_id = None
+        self.run = 0
+        self._conf_sum = 0.0
+
+
+def create_stabilizer(kind: str, history_len: int, alpha: float = 0.5,
+                      margin: float = 0.4, min_frames: int = 2,
+                      conf_low: float = 0.5, conf_high: float = 0.9) -> Stabilizer:
+    """
+    설정 이름으로 안정화기 생성.
+    kind: 'run_length' | 'ema' | 'adaptive'
+        - history_len 은 모든 방식의 최대(상한) 연속 프레임 수
+        - alpha/margin 은 'ema', conf_low/conf_high 는 'adaptive' 에만 사용
+    """
+    if kind == 'run_length':
+        return RunLengthStabilizer(history_len)
+    if kind == 'ema':
+        return EmaStabilizer(history_len, alpha=alpha, margin=margin, min_frames=min_frames)
+    if kind == 'adaptive':
+        return AdaptiveStabilizer(min_frames, history_len, conf_low=conf_low, conf_high=conf_high)
+    raise ValueError(f"알 수 없는 안정화 방식: {kind}")
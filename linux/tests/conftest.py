@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""테스트에서 프로젝트 모듈(engine, models, ...)을 import 할 수 있도록 프로젝트 루트를 경로에 추가"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+특징 추출 경로 테스트.
+- 랜드마크 -> 특징 -> 모델 입력까지 FEATURE_DTYPE(float32) 가 유지되는지 확인합니다.
+- 실시간 경로(FeatureBuilder)와 학습 경로(extract_features_batch)는 같은 특징을 따로 계산하므로,
+  두 경로가 행 단위로 같은 값을 내는지 확인합니다 (한 손만 감지된 행 포함).
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from engine.features import (FEATURE_DTYPE, NUM_FEATURES, FeatureBuilder, extract_features_batch,
+                             hand_feature_index)
+from engine.landmark_converter import LandmarkConverter
+from engine.landmark_filter import LandmarkFilter
+
+
+def _landmarks(n: int = 32, seed: int = 0) -> np.ndarray:
+    """(N, 2, 21, 3) 랜드마크. 4행마다 왼손만 / 오른손만 / 두 손 없음 / 두 손 순서"""
+    landmarks = np.random.default_rng(seed).random((n, 2, 21, 3)).astype(FEATURE_DTYPE)
+    landmarks[0::4, 1] = 0
+    landmarks[1::4, 0] = 0
+    landmarks[2::4] = 0
+    return landmarks
+
+
+def _build(builder: FeatureBuilder, sample: np.ndarray) -> np.ndarray:
+    """실시간 경로와 같은 순서로 한 샘플의 특징 벡터 계산"""
+    builder.reset()
+    for hand in (0, 1):
+        if sample[hand].any():
+            builder.set_hand(hand, sample[hand])
+    return builder.vector().copy()
+
+
+def test_landmark_converter_dtype():
+    landmark = [SimpleNamespace(x=x, y=y, z=z) for x, y, z in np.random.default_rng(0).random((21, 3)).tolist()]
+    results = SimpleNamespace(
+        multi_hand_landmarks=[SimpleNamespace(landmark=landmark)],
+        multi_handedness=[SimpleNamespace(classification=[SimpleNamespace(label='Right')])])
+    converter = LandmarkConverter()
+    buffer = converter.convert(results)
+    assert buffer.dtype == FEATURE_DTYPE
+    assert converter.present.tolist() == [False, True]
+
+
+def test_landmark_filter_dtype():
+    landmark_filter = LandmarkFilter()
+    present = np.array([True, True])
+    landmarks = _landmarks(4)[3]
+    for now in (0.0, 1 / 30):
+        output = landmark_filter.apply(landmarks, present, now)
+    assert output.dtype == FEATURE_DTYPE
+
+
+def test_extract_features_batch_dtype():
+    features = extract_features_batch(_landmarks())
+    assert features.dtype == FEATURE_DTYPE
+    assert features.shape == (32, NUM_FEATURES)
+
+
+def test_feature_builder_dtype():
+    builder = FeatureBuilder()
+    # float64 랜드마크(사용자 필터 등)도 그대로 받아 float32 벡터를 만듦
+    vector = _build(builder, _landmarks()[3].astype(np.float64))
+    assert vector.dtype == FEATURE_DTYPE
+    assert vector.shape == (1, NUM_FEATURES)
+
+
+def test_feature_builder_matches_batch():
+    landmarks = _landmarks()
+    expected = extract_features_batch(landmarks)
+    builder = FeatureBuilder()
+    for sample, row in zip(landmarks, expected):
+        np.testing.assert_array_equal(_build(builder, sample)[0], row)
+
+
+@pytest.mark.parametrize('feature_index', [hand_feature_index(1), np.array([0, 7, 31, 100, 152, 165])])
+def test_feature_builder_selected_matches_batch(feature_index):
+    landmarks = _landmarks()
+    expected = extract_features_batch(landmarks)[:, feature_index]
+    builder = FeatureBuilder(feature_index)
+    for sample, row in zip(landmarks, expected):
+        np.testing.assert_array_equal(_build(builder, sample)[0], row)
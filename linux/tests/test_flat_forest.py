@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+평탄화 예측기 테스트.
+- FlatForest / HandCascade.flatten() 이 원래 모델과 같은 예측 클래스와 정확히 같은 확률을 내는지 확인합니다.
+- 학습/예측 입력은 extract_features_batch 로 만든 실제 특징 행렬입니다 (한 손만 감지된 행 포함).
+"""
+import numpy as np
+import pytest
+from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier
+
+from engine.cascade import HandCascade
+from engine.features import FEATURE_DTYPE, extract_features_batch
+from engine.flat_forest import FlatForest
+
+LABELS = np.array(['ㄱ', 'ㄴ', 'ㅏ', 'ㅗ'])
+MODELS = [
+    lambda: RandomForestClassifier(n_estimators=8, random_state=0),
+    lambda: ExtraTreesClassifier(n_estimators=8, random_state=0),
+]
+
+
+def _dataset(n: int = 240, seed: int = 0):
+    """(특징 행렬, 레이블). 3행마다 왼손만 / 오른손만 / 두 손"""
+    rng = np.random.default_rng(seed)
+    landmarks = rng.random((n, 2, 21, 3)).astype(FEATURE_DTYPE)
+    landmarks[0::3, 1] = 0
+    landmarks[1::3, 0] = 0
+    return extract_features_batch(landmarks), LABELS[rng.integers(len(LABELS), size=n)]
+
+
+@pytest.mark.parametrize('make_model', MODELS, ids=['random_forest', 'extra_trees'])
+def test_flat_forest_matches_model(make_model):
+    X, y = _dataset()
+    X_test, _ = _dataset(seed=1)
+    model = make_model().fit(X, y)
+    flat = FlatForest.from_model(model)
+    np.testing.assert_array_equal(flat.predict(X_test), model.predict(X_test))
+    np.testing.assert_array_equal(flat.predict_proba(X_test), model.predict_proba(X_test))
+
+
+@pytest.mark.parametrize('make_model', MODELS, ids=['random_forest', 'extra_trees'])
+def test_cascade_flatten_matches_cascade(make_model):
+    X, y = _dataset()
+    X_test, _ = _dataset(seed=1)
+    cascade = HandCascade.fit(X, y, make_model)
+    flat = cascade.flatten()
+    assert all(isinstance(model, FlatForest) for model in flat.models.values())
+    np.testing.assert_array_equal(flat.predict(X_test), cascade.predict(X_test))
+    np.testing.assert_array_equal(flat.predict_proba(X_test), cascade.predict_proba(X_test))
+    # 실시간 한 행 예측 경로
+    for row in X_test[:6]:
+        np.testing.assert_array_equal(flat.predict_proba(row[np.newaxis]), cascade.predict_proba(row[np.newaxis]))
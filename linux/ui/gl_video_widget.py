@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+OpenGL 카메라 화면 위젯 (config/settings.py VIDEO_WIDGET = 'opengl').
+- QLabel.setPixmap 경로와 달리 GUI 스레드에서 QPixmap 변환/크기 조정을 하지 않습니다.
+  프레임(BGR 배열)을 복사 없이 QImage 로 감싸 paintGL 에서 텍스처로 업로드하고,
+  화면 크기에 맞춘 확대/축소는 렌더러(GPU, GPU 가 없으면 Mesa 소프트웨어 GL)가 처리합니다.
+- 손 골격과 레이블/FPS/HUD 는 프레임 픽셀에 그리지 않고 벡터 도형(선, 점, 텍스트)으로 그 위에 그립니다.
+  골격/레이블은 프레임 좌표로 그린 뒤 프레임과 같은 변환으로 확대되므로 QLabel 경로와 같은 위치/크기입니다.
+- QOpenGLWidget 생성 자체는 항상 성공하므로, 화면을 고르기 전에 opengl_available() 로 컨텍스트를 실제로 만들어 확인합니다.
+"""
+import numpy as np
+from PyQt5.QtCore import Qt, QLineF, QPointF, QRectF
+from PyQt5.QtGui import (QColor, QFont, QFontMetricsF, QImage, QOffscreenSurface, QOpenGLContext,
+                         QPainter, QPen, QPolygonF)
+from PyQt5.QtWidgets import QOpenGLWidget
+
+from config.settings import DISPLAY_SMOOTH_SCALING
+from ui.visualizer import HAND_CONNECTIONS, OverlayRenderer, SkeletonRenderer, visible_landmarks
+
+# Qt 5.14+ 에서만 지원 (없으면 RGB 변환 후 업로드)
+BGR888 = getattr(QImage, 'Format_BGR888', None)
+
+
+def opengl_available() -> bool:
+    """
+    OpenGL 2.0 이상 컨텍스트를 만들고 화면 밖 표면에서 활성화할 수 있는지 확인 (QApplication 생성 후 호출).
+    드라이버/GLX 문제로 실패하면 False (QOpenGLWidget 은 이 경우에도 생성되지만 검은 화면만 표시됨).
+    """
+    context = QOpenGLContext()
+    if not context.create() or context.format().majorVersion() < 2:
+        return False
+    surface = QOffscreenSurface()
+    surface.setFormat(context.format())
+    surface.create()
+    if not surface.isValid() or not context.makeCurrent(surface):
+        return False
+    context.doneCurrent()
+    return True
+
+
+def _qcolor(bgr) -> QColor:
+    return QColor(bgr[2], bgr[1], bgr[0])
+
+
+class GLVideoWidget(QOpenGLWidget):
+    """
+    프레임 텍스처 + 벡터 오버레이를 그리는 카메라 화면.
+    - set_frame(frame, overlay) 로 프레임과 오버레이 항목(GestureRecognizer.last_overlay)을 받고 다시 그리기를 요청합니다.
+    - QPainter 의 OpenGL 페인트 엔진이 QImage 를 텍스처로 올리고 변환 행렬로 크기를 맞춰 그립니다.
+    """
+    BACKGROUND = QColor(0x2E, 0x2E, 0x2E)
+    HUD_PIXEL_SIZE = 13
+    HUD_LINE = 18
+
+    def __init__(self, parent=None, label_pos=(50, 420), label_size: int = 40, padding: int = 10):
+        """
+        Args:
+            label_pos          : 레이블/안내 텍스트 위치 (프레임 좌표, OverlayRenderer 와 같음)
+            label_size (int)   : 레이블/안내 텍스트 글자 크기 (프레임 픽셀)
+            padding (int)      : 레이블 배경 박스 여백 (프레임 픽셀)
+            self._frame        : 현재 프레임 배열 (QImage 가 이 메모리를 직접 참조하므로 다음 프레임까지 보관)
+            self._overlay      : 현재 프레임의 오버레이 항목 (None 이면 프레임만 그림)
+        """
+        super().__init__(parent)
+        self.label_pos = label_pos
+        self.label_size = label_size
+        self.padding = padding
+        self._frame = None
+        self._image = None
+        self._overlay = None
+        # 두 손 연결선 양 끝 인덱스 (손 오프셋 포함, (2 x 21, 2))
+        self._segments = np.concatenate([HAND_CONNECTIONS, HAND_CONNECTIONS + 21])
+        self._line_pen = QPen(_qcolor(SkeletonRenderer.LINE_COLOR), SkeletonRenderer.THICKNESS,
+                              Qt.SolidLine, Qt.RoundCap)
+        # 관절점: 둥근 끝 펜의 점 = 펜 굵기를 지름으로 하는 원 (SkeletonRenderer 와 같은 크기)
+        border = max(SkeletonRenderer.RADIUS + 1, int(SkeletonRenderer.RADIUS * 1.2))
+        self._border_pen = QPen(_qcolor(SkeletonRenderer.BORDER_COLOR), 2 * border + SkeletonRenderer.THICKNESS,
+                                Qt.SolidLine, Qt.RoundCap)
+        self._joint_pen = QPen(_qcolor(SkeletonRenderer.JOINT_COLOR),
+                               2 * SkeletonRenderer.RADIUS + SkeletonRenderer.THICKNESS, Qt.SolidLine, Qt.RoundCap)
+
+    def set_frame(self, frame: np.ndarray, overlay: dict = None):
+        """BGR 프레임과 오버레이 항목을 받아 다시 그리기 요청 (크기 조정/변환 없이 참조만 보관)"""
+        if BGR888 is None:
+            frame = frame[:, :, ::-1]
+        if not frame.flags['C_CONTIGUOUS']:
+            frame = np.ascontiguousarray(frame)
+        h, w, ch = frame.shape
+        self._frame = frame
+        self._image = QImage(frame.data, w, h, ch * w, BGR888 if BGR888 is not None else QImage.Format_RGB888)
+        self._overlay = overlay
+        self.update()
+
+    def _frame_rect(self) -> QRectF:
+        """가로세로 비율을 유지하며 위젯 가운데에 맞춘 프레임 영역"""
+        w, h = self._image.width(), self._image.height()
+        scale = min(self.width() / w, self.height() / h)
+        return QRectF((self.width() - w * scale) / 2, (self.height() - h * scale) / 2, w * scale, h * scale)
+
+    def paintGL(self):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.BACKGROUND)
+        if self._image is None:
+            painter.end()
+            return
+        target = self._frame_rect()
+        # 프레임 좌표 -> 화면 좌표 변환 (이후 프레임/골격/레이블은 프레임 좌표로 그림)
+        painter.translate(target.x(), target.y())
+        painter.scale(target.width() / self._image.width(), target.height() / self._image.height())
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, DISPLAY_SMOOTH_SCALING)
+        painter.drawImage(QRectF(0, 0, self._image.width(), self._image.height()), self._image)
+
+        overlay = self._overlay
+        if overlay is not None:
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            if overlay['landmarks'] is not None:
+                self._draw_skeleton(painter, overlay['landmarks'], overlay['present'])
+            self._draw_label(painter, overlay['text'])
+            # FPS/HUD 는 화면 크기와 관계없이 같은 글자 크기로 화면 좌표에 그림
+            painter.resetTransform()
+            if overlay['fps'] is not None:
+                self._draw_fps(painter, overlay['fps'])
+            if overlay['hud']:
+                self._draw_hud(painter, overlay['hud'])
+        painter.end()
+
+    def _draw_skeleton(self, painter: QPainter, landmarks: np.ndarray, present: np.ndarray):
+        """감지된 손의 연결선과 관절점 (landmarks: (2, 21, 2) 정규화 좌표, 화면 밖 랜드마크와 그 연결선은 건너뜀)"""
+        visible = visible_landmarks(landmarks, present).reshape(42)
+        points = (landmarks * (self._image.width(), self._image.height())).reshape(42, 2)
+        segments = self._segments[visible[self._segments].all(axis=1)]
+        lines = points[segments].reshape(-1, 4).tolist()
+        joints = QPolygonF([QPointF(x, y) for x, y in points[visible].tolist()])
+        painter.setPen(self._line_pen)
+        if lines:
+            painter.drawLines([QLineF(*line) for line in lines])
+        painter.setPen(self._border_pen)
+        painter.drawPoints(joints)
+        painter.setPen(self._joint_pen)
+        painter.drawPoints(joints)
+
+    def _draw_label(self, painter: QPainter, text: str):
+        """레이블/안내 텍스트 + 검은색 배경 박스 (TextOverlay 기본값과 같은 모양)"""
+        if not text:
+            return
+        font = QFont(self.font())
+        font.setPixelSize(self.label_size)
+        metrics = QFontMetricsF(font)
+        # pos 는 텍스트 윗부분 기준 (PIL 과 같음) -> Qt 기준선 위치로 변환
+        x, y = self.label_pos
+        baseline = QPointF(x, y + metrics.ascent())
+        box = metrics.tightBoundingRect(text).translated(baseline)
+        painter.fillRect(box.adjusted(-self.padding, -self.padding, self.padding, self.padding), Qt.black)
+        painter.setFont(font)
+        painter.setPen(Qt.white)
+        painter.drawText(baseline, text)
+
+    def _hud_font(self) -> QFont:
+        font = QFont(self.font())
+        font.setPixelSize(self.HUD_PIXEL_SIZE)
+        return font
+
+    def _draw_fps(self, painter: QPainter, fps: float):
+        """오른쪽 위 FPS"""
+        text = f"FPS {fps:4.1f}"
+        font = self._hud_font()
+        metrics = QFontMetricsF(font)
+        w, h = metrics.boundingRect(text).width(), metrics.height()
+        x, y = self.width() - w - 10, 10
+        painter.fillRect(QRectF(x - 5, y - 5, w + 10, h + 10), QColor(0, 0, 0, 153))
+        painter.setFont(font)
+        painter.setPen(Qt.white)
+        painter.drawText(QPointF(x, y + metrics.ascent()), text)
+
+    def _draw_hud(self, painter: QPainter, hud: dict):
+        """왼쪽 위 디버그 HUD (OverlayRenderer.draw_hud 와 같은 항목)"""
+        lines = OverlayRenderer.hud_lines(hud)
+        font = self._hud_font()
+        metrics = QFontMetricsF(font)
+        width = max(metrics.boundingRect(line).width() for line in lines)
+        painter.fillRect(QRectF(5, 5, width + 10, self.HUD_LINE * len(lines) + 5), QColor(0, 0, 0, 153))
+        painter.setFont(font)
+        painter.setPen(Qt.white)
+        for i, line in enumerate(lines):
+            painter.drawText(QPointF(10, 5 + self.HUD_LINE * (i + 1) - 4), line)
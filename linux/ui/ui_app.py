@@ -1,19 +1,24 @@
 # -*- coding: utf-8 -*-
 import sys
 import cv2
+import numpy as np
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QTextEdit, QHBoxLayout, QVBoxLayout,
     QPushButton, QShortcut, QPlainTextEdit, QLineEdit, QApplication
 )
 from PyQt5.QtGui import QImage, QPixmap, QKeySequence, QIcon, QFontDatabase
-from PyQt5.QtCore import Qt, QPoint, QEvent
+from PyQt5.QtCore import Qt, QPoint, QEvent, QTimer
 
 from config.paths import ICON_IMG, FONT_PATH
+from config.settings import DISPLAY_SMOOTH_SCALING, VIDEO_WIDGET
 from engine.hangul_assembler import HangulAssembler
 from ui.video_thread import VideoThread
 from ui.windows import HelpWindow, SettingsWindow
 from engine.hand_tts import HandTTS
 
+# Qt 5.14+ 에서만 지원 (없으면 RGB 변환 후 표시)
+BGR888 = getattr(QImage, 'Format_BGR888', None)
+
 class SignLanguageTranslatorApp(QWidget):
     def __init__(self, model, encoder):
         super().__init__()
@@ -27,9 +32,11 @@ class SignLanguageTranslatorApp(QWidget):
         self.is_paused = False
         self.show_landmarks = True
 
-        self.camera_view = QLabel(self)
-        self.camera_view.setObjectName("cameraView")
-        self.camera_view.setMinimumSize(600, 480)
+        self.camera_view = self._create_camera_view(use_opengl=(VIDEO_WIDGET == 'opengl'))
+        # OpenGL 화면이면 오버레이를 프레임에 그리지 않고 화면이 벡터로 그림
+        self.vector_overlay = not isinstance(self.camera_view, QLabel)
+        # 현재 표시 중인 프레임 배열 (QImage 가 이 메모리를 직접 참조하므로 다음 프레임까지 보관)
+        self._frame_buffer = None
 
         self.pause_button = QPushButton("일시정지")
         self.settings_button = QPushButton("설정")
@@ -90,10 +97,17 @@ class SignLanguageTranslatorApp(QWidget):
         self.help_window, self.settings_window = None, None
         self.assembler = HangulAssembler()
 
-        self.thread = VideoThread(model, encoder)
+        self.thread = VideoThread(model, encoder, vector_overlay=self.vector_overlay)
         self.thread.change_pixmap_signal.connect(self.update_image)
+        self.thread.change_frame_signal.connect(self.update_frame)
         self.thread.update_text_signal.connect(self.update_text)
         self.thread.start()
+        # 화면 크기 변경을 영상 스레드에 알림 (프레임 크기 맞춤을 스레드에서 처리, OpenGL 화면은 GPU 가 처리)
+        if not self.vector_overlay:
+            self.camera_view.installEventFilter(self)
+        else:
+            # 표시 후에도 OpenGL 초기화에 실패했으면(검은 화면) QLabel 화면으로 교체
+            QTimer.singleShot(1000, self._check_camera_view)
 
         self.quit_shortcut = QShortcut(QKeySequence('q'), self, context = Qt.WindowShortcut)
         self.quit_shortcut.activated.connect(self.close)   
@@ -103,6 +117,47 @@ class SignLanguageTranslatorApp(QWidget):
 
         self.tts = HandTTS(self)
 
+    def _create_camera_view(self, use_opengl: bool):
+        """
+        카메라 화면 생성.
+        use_opengl 이면 OpenGL 컨텍스트를 실제로 만들어 본 뒤 GLVideoWidget 을, 만들 수 없으면 QLabel 을 사용
+        """
+        view = None
+        if use_opengl:
+            try:
+                from ui.gl_video_widget import GLVideoWidget, opengl_available
+                if opengl_available():
+                    view = GLVideoWidget(self)
+                else:
+                    print("!!! OpenGL 컨텍스트를 만들 수 없어 기본 화면(QLabel)으로 표시합니다 !!!")
+            except Exception as e:
+                print("!!! OpenGL 화면을 사용할 수 없어 기본 화면(QLabel)으로 표시합니다 !!! :", e)
+        if view is None:
+            view = QLabel(self)
+        view.setObjectName("cameraView")
+        view.setMinimumSize(600, 480)
+        return view
+
+    def _check_camera_view(self):
+        """OpenGL 화면이 표시된 뒤에도 초기화되지 않았으면 QLabel 화면으로 교체하고 오버레이를 프레임에 그리도록 전환"""
+        if not self.vector_overlay or self.camera_view.isValid():
+            return
+        if not self.camera_view.isVisible():
+            # 아직 표시되지 않았으면(최소화 등) 나중에 다시 확인
+            QTimer.singleShot(1000, self._check_camera_view)
+            return
+        print("!!! OpenGL 화면 초기화에 실패해 기본 화면(QLabel)으로 전환합니다 !!!")
+        # 교체 전에 끊어야 이미 대기 중인 프레임 신호가 QLabel 로 전달되지 않음 (update_frame 에서도 한 번 더 확인)
+        self.thread.change_frame_signal.disconnect(self.update_frame)
+        label = self._create_camera_view(use_opengl=False)
+        self.layout().replaceWidget(self.camera_view, label)
+        self.camera_view.deleteLater()
+        self.camera_view = label
+        self.vector_overlay = False
+        self.thread.set_vector_overlay(False)
+        label.installEventFilter(self)
+        self.thread.set_display_size(label.width(), label.height())
+
     def toggle_pause_resume(self):
         self.is_paused = not self.is_paused
         if self.is_paused:
@@ -166,11 +221,33 @@ class SignLanguageTranslatorApp(QWidget):
     def update_image(self, cv_img):
         qt_img = self.convert_cv_qt(cv_img); self.camera_view.setPixmap(qt_img)
 
+    def update_frame(self, cv_img, overlay):
+        """[OpenGL 화면] 원본 프레임 + 오버레이 항목 전달 (텍스처 업로드/크기 조정/오버레이는 paintGL 에서 처리)"""
+        if not self.vector_overlay:
+            return  # QLabel 화면으로 교체된 뒤 도착한 프레임
+        self.camera_view.set_frame(cv_img, overlay)
+
     def convert_cv_qt(self, cv_img):
-        rgb_image = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        p = QPixmap.fromImage(QImage(rgb_image.data, w, h, ch * w, QImage.Format_RGB888))
-        return p.scaled(self.camera_view.width(), self.camera_view.height(), Qt.KeepAspectRatio)
+        """
+        BGR 프레임 -> QPixmap.
+        - Qt 5.14+ 는 BGR 버퍼를 Format_BGR888 로 바로 감싸 색 변환 없이 사용 (이전 버전은 RGB 변환)
+        - QImage 는 배열 메모리를 복사 없이 참조하므로, 배열을 self._frame_buffer 에 보관해 살려 둠
+        - 영상 스레드가 이미 화면 크기에 맞춰 보냈으면 크기 조정을 건너뜀.
+          맞지 않으면 DISPLAY_SMOOTH_SCALING 설정에 따라 빠른/부드러운 보간으로 조정
+        """
+        if BGR888 is None:
+            cv_img = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
+        elif not cv_img.flags['C_CONTIGUOUS']:
+            cv_img = np.ascontiguousarray(cv_img)
+        self._frame_buffer = cv_img
+        h, w, ch = cv_img.shape
+        image = QImage(cv_img.data, w, h, ch * w, BGR888 if BGR888 is not None else QImage.Format_RGB888)
+        p = QPixmap.fromImage(image)
+        view_w, view_h = self.camera_view.width(), self.camera_view.height()
+        if (w == view_w and h <= view_h) or (h == view_h and w <= view_w):
+            return p
+        mode = Qt.SmoothTransformation if DISPLAY_SMOOTH_SCALING else Qt.FastTransformation
+        return p.scaled(view_w, view_h, Qt.KeepAspectRatio, mode)
     
     
     def _handle_quit_shortcut(self):
@@ -186,7 +263,9 @@ class SignLanguageTranslatorApp(QWidget):
         super().mousePressEvent(event)
         
     def eventFilter(self, source, event):
-        """Linedit의 포커스 이벤트에 따라 q 단축키 활성화 유무 결정"""
+        """Linedit의 포커스 이벤트에 따라 q 단축키 활성화 유무 결정, 화면 크기 변경을 영상 스레드에 전달"""
+        if source == self.camera_view and event.type() == QEvent.Resize:
+            self.thread.set_display_size(self.camera_view.width(), self.camera_view.height())
         if source == self.bottom_input:
             if event.type() == QEvent.FocusIn:
                 # 입력창에 포커스가 들어오면 q 단축키 비활성화
@@ -1,10 +1,247 @@
 # -*- coding: utf-8 -*-
+from functools import lru_cache
+
 import cv2
 import numpy as np
 from PIL import ImageFont, ImageDraw, Image
 from config.paths import FONT_PATH
 
 
+class TextOverlay:
+    """
+    한글 텍스트(반투명 배경 박스 + 텍스트) 오버레이 렌더러.
+    - 폰트는 크기별로 한 번만 로드합니다.
+    - (텍스트, 크기, 색, 배경 투명도, 여백)별로 렌더링한 스프라이트를 LRU 캐시에 보관하고,
+      프레임에는 스프라이트 영역(ROI)만 NumPy 로 알파 합성합니다 (프레임 전체 색 변환/PIL 변환 없음).
+    - 기본값은 putText_korean 의 실제 결과와 픽셀 단위로 같습니다 (흰색 텍스트, 검은색 박스, 여백 10).
+      putText_korean 은 RGBA 이미지에 직접 그려 박스 알파(100)가 합성되지 않고 불투명하게 나오므로
+      bg_alpha 기본값도 255 입니다. 반투명 박스가 필요하면 bg_alpha 를 낮추면 됩니다.
+    """
+    def __init__(self, font_path=FONT_PATH, cache_size: int = 32):
+        """
+        Args:
+            font_path        : 폰트 파일 경로
+            cache_size (int) : 스프라이트 캐시 최대 개수
+            self._fonts      : 글자 크기 -> ImageFont (한 번만 로드)
+        """
+        self.font_path = font_path
+        self._fonts = {}
+        self._sprite = lru_cache(maxsize=cache_size)(self._render_sprite)
+
+    def _font(self, font_size: int):
+        font = self._fonts.get(font_size)
+        if font is None:
+            font = self._fonts[font_size] = ImageFont.truetype(str(self.font_path), font_size)
+        return font
+
+    def _render_sprite(self, text: str, font_size: int, text_color: tuple, bg_alpha: int, padding: int):
+        """
+        스프라이트 생성. 반환: (x 오프셋, y 오프셋, keep, add)
+            - 오프셋: 텍스트 기준 위치(pos)에서 박스 왼쪽 위까지 거리
+            - 합성식: roi = roi * keep + add
+              (배경 박스 b 위에 텍스트 t 를 덮는 것과 같음: keep = (1 - b)(1 - t), add = 색 * t)
+        """
+        font = self._font(font_size)
+        left, top, right, bottom = font.getbbox(text)
+        width = right - left + 2 * padding + 1
+        height = bottom - top + 2 * padding + 1
+
+        mask = Image.new('L', (width, height), 0)
+        ImageDraw.Draw(mask).text((padding - left, padding - top), text, font=font, fill=255)
+        t = np.asarray(mask, dtype=np.float32)[:, :, np.newaxis] / 255.0
+        keep = (1.0 - bg_alpha / 255.0) * (1.0 - t)
+        # 반올림용 0.5 를 미리 더해 둠
+        add = t * np.array(text_color, dtype=np.float32) + 0.5
+        return left - padding, top - padding, keep, add
+
+    def draw(self, image: np.ndarray, text: str, pos, font_size: int = 40,
+             text_color: tuple = (255, 255, 255), bg_alpha: int = 255, padding: int = 10) -> np.ndarray:
+        """
+        BGR 프레임 image 에 텍스트를 제자리에서 합성하고 image 를 반환.
+        pos: 텍스트 기준 위치 (putText_korean 과 같음), text_color: BGR
+        """
+        if not text:
+            return image
+        dx, dy, keep, add = self._sprite(text, font_size, tuple(text_color), bg_alpha, padding)
+        x0, y0 = pos[0] + dx, pos[1] + dy
+        # 프레임 밖으로 나가는 부분 잘라냄
+        h, w = keep.shape[:2]
+        sx0, sy0 = max(0, -x0), max(0, -y0)
+        sx1, sy1 = min(w, image.shape[1] - x0), min(h, image.shape[0] - y0)
+        if sx0 >= sx1 or sy0 >= sy1:
+            return image
+        roi = image[y0 + sy0:y0 + sy1, x0 + sx0:x0 + sx1]
+        blended = roi * keep[sy0:sy1, sx0:sx1]
+        blended += add[sy0:sy1, sx0:sx1]
+        np.copyto(roi, blended, casting='unsafe')
+        return image
+
+
+
+# 손 관절 연결 (mediapipe HAND_CONNECTIONS 와 동일한 21개)
+HAND_CONNECTIONS = np.array([(0, 1), (1, 2), (2, 3), (3, 4),
+                             (0, 5), (5, 6), (6, 7), (7, 8),
+                             (5, 9), (9, 10), (10, 11), (11, 12),
+                             (9, 13), (13, 14), (14, 15), (15, 16),
+                             (13, 17), (0, 17), (17, 18), (18, 19), (19, 20)], dtype=np.intp)
+
+
+def visible_landmarks(landmarks: np.ndarray, present: np.ndarray) -> np.ndarray:
+    """
+    그릴 관절 (2, 21) bool: 감지된 손(present)이고 x, y 가 화면 안(0~1)인 랜드마크.
+    draw_landmarks 와 같이 화면 밖 랜드마크는 관절점과 연결선을 모두 그리지 않습니다.
+    """
+    xy = landmarks[:, :, :2]
+    return present[:, np.newaxis] & np.all((xy >= 0) & (xy <= 1), axis=2)
+
+
+class SkeletonRenderer:
+    """
+    손 랜드마크 골격 렌더러 (mediapipe drawing_utils.draw_landmarks 를 근사).
+    - (2, 21, 3) 랜드마크 버퍼를 한 번의 NumPy 연산으로 픽셀 좌표로 바꾸고,
+      두 손의 모든 연결선을 cv2.polylines 한 번, 관절점을 테두리/안쪽 두 번의 호출로 그립니다.
+    - 연결선/관절 인덱스 배열은 생성 시 한 번만 만듭니다.
+    - 색/굵기는 draw_landmarks 기본값 (연결선 회색, 관절 흰 테두리 + 빨간 점)을 따르고,
+      화면 밖(0~1 범위 밖) 랜드마크와 그 연결선은 그리지 않습니다.
+      draw_landmarks 는 관절을 굵기 2 의 원(고리)으로 그리지만, 여기서는 같은 지름의 채운 원으로 그립니다.
+    """
+    LINE_COLOR = (224, 224, 224)
+    BORDER_COLOR = (224, 224, 224)
+    JOINT_COLOR = (0, 0, 255)
+    THICKNESS = 2
+    RADIUS = 2
+
+    def __init__(self):
+        # 두 손 연결선 양 끝 인덱스 (손 오프셋 포함, (2 x 21, 2)), 관절점은 길이 0인 선 (42, 2)
+        self._segments = np.concatenate([HAND_CONNECTIONS, HAND_CONNECTIONS + 21])
+        self._joints = np.repeat(np.arange(42, dtype=np.intp)[:, np.newaxis], 2, axis=1)
+        self._pixels = np.empty((2, 21, 2), dtype=np.int32)
+        self._scale = np.empty(2, dtype=np.float32)
+
+    def draw(self, image: np.ndarray, landmarks: np.ndarray, present: np.ndarray) -> np.ndarray:
+        """
+        감지된 손(present)의 골격을 BGR 프레임 image 에 제자리에서 그리고 image 반환.
+        landmarks: (2, 21, 3) 정규화 좌표 (x, y 는 0~1, 범위 밖 랜드마크는 건너뜀)
+        """
+        visible = visible_landmarks(landmarks, present).reshape(42)
+        if not visible.any():
+            return image
+        h, w = image.shape[:2]
+        self._scale[:] = (w, h)
+        # 정규화 좌표 -> 픽셀 좌표 (draw_landmarks 와 같이 내림 + 화면 끝으로 제한)
+        pixels = np.floor(landmarks[:, :, :2] * self._scale)
+        np.minimum(pixels, (w - 1, h - 1), out=pixels)
+        np.copyto(self._pixels, pixels, casting='unsafe')
+
+        points = self._pixels.reshape(42, 2)
+        segments, joints = self._segments, self._joints
+        if not visible.all():
+            # 양 끝이 모두 보이는 연결선과 보이는 관절만
+            segments = segments[visible[segments].all(axis=1)]
+            joints = joints[visible]
+        if len(segments):
+            cv2.polylines(image, points[segments], False, self.LINE_COLOR, self.THICKNESS)
+        # 길이 0인 선은 굵기를 지름으로 하는 원으로 그려지므로 관절점 전체를 한 번에 그림
+        # (draw_landmarks: 반지름 3 흰 테두리 원 + 반지름 2 빨간 원, 선 굵기 2)
+        joints = points[joints]
+        border = max(self.RADIUS + 1, int(self.RADIUS * 1.2))
+        cv2.polylines(image, joints, False, self.BORDER_COLOR, 2 * border + self.THICKNESS)
+        cv2.polylines(image, joints, False, self.JOINT_COLOR, 2 * self.RADIUS + self.THICKNESS)
+        return image
+
+
+def resize_to_fit(image: np.ndarray, width: int, height: int) -> np.ndarray:
+    """
+    가로세로 비율을 유지하며 (width, height) 안에 맞게 축소/확대 (QPixmap.scaled(KeepAspectRatio) 와 같은 크기).
+    크기가 같으면 그대로 반환. 축소는 INTER_AREA, 확대는 INTER_LINEAR.
+    """
+    h, w = image.shape[:2]
+    scale = min(width / w, height / h)
+    size = (max(1, int(w * scale)), max(1, int(h * scale)))
+    if size == (w, h) or width <= 0 or height <= 0:
+        return image
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR)
+
+def shade_rect(image: np.ndarray, x0: int, y0: int, x1: int, y1: int, alpha: float):
+    """BGR 프레임의 사각형 영역만 제자리에서 검은색으로 alpha 만큼 어둡게 함 (프레임 밖은 잘라냄)"""
+    x0, y0 = max(0, x0), max(0, y0)
+    x1, y1 = min(image.shape[1], x1), min(image.shape[0], y1)
+    if x0 < x1 and y0 < y1:
+        roi = image[y0:y1, x0:x1]
+        np.multiply(roi, 1.0 - alpha, out=roi, casting='unsafe')
+
+
+class OverlayRenderer:
+    """
+    프레임 오버레이 묶음: 레이블/안내 텍스트 박스, FPS, 디버그 HUD.
+    - 모든 요소는 BGR 프레임에서 자기 영역만 제자리 합성합니다 (프레임 전체 색 변환/복사 없음).
+    - 한글 레이블은 TextOverlay 스프라이트 캐시, 매 프레임 바뀌는 FPS/HUD 숫자는 cv2.putText 로 그립니다.
+    """
+    HUD_FONT = cv2.FONT_HERSHEY_SIMPLEX
+    HUD_SCALE = 0.45
+    HUD_LINE = 18
+
+    def __init__(self, font_path=FONT_PATH, show_fps: bool = False, show_hud: bool = False,
+                 label_pos=(50, 420), label_size: int = 40):
+        """
+        Args:
+            show_fps (bool)   : 오른쪽 위 FPS 표시 여부
+            show_hud (bool)   : 왼쪽 위 디버그 HUD(render 의 hud 항목) 표시 여부
+            label_pos         : 레이블/안내 텍스트 위치
+            label_size (int)  : 레이블/안내 텍스트 글자 크기
+            self.fps          : 평활된 현재 FPS
+        """
+        self.text = TextOverlay(font_path)
+        self.show_fps = show_fps
+        self.show_hud = show_hud
+        self.label_pos = label_pos
+        self.label_size = label_size
+        self.fps = 0.0
+        self._last_time = None
+
+    def tick(self, now: float):
+        """프레임마다 호출해 FPS 갱신 (EMA)"""
+        if self._last_time is not None and now > self._last_time:
+            fps = 1.0 / (now - self._last_time)
+            self.fps = fps if self.fps == 0.0 else 0.9 * self.fps + 0.1 * fps
+        self._last_time = now
+
+    def draw_fps(self, image: np.ndarray):
+        """오른쪽 위 FPS 표시"""
+        text = f"FPS {self.fps:4.1f}"
+        (w, h), base = cv2.getTextSize(text, self.HUD_FONT, self.HUD_SCALE, 1)
+        x, y = image.shape[1] - w - 10, 10 + h
+        shade_rect(image, x - 5, y - h - 5, x + w + 5, y + base + 5, 0.6)
+        cv2.putText(image, text, (x, y), self.HUD_FONT, self.HUD_SCALE, (255, 255, 255), 1, cv2.LINE_AA)
+
+    @staticmethod
+    def hud_lines(hud: dict) -> list:
+        """디버그 HUD 항목 -> '이름: 값' 줄 목록 (실수는 소수 둘째 자리)"""
+        return [f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}"
+                for key, value in hud.items()]
+
+    def draw_hud(self, image: np.ndarray, hud: dict):
+        """왼쪽 위 디버그 HUD (항목마다 '이름: 값' 한 줄)"""
+        lines = self.hud_lines(hud)
+        if not lines:
+            return
+        width = max(cv2.getTextSize(line, self.HUD_FONT, self.HUD_SCALE, 1)[0][0] for line in lines)
+        shade_rect(image, 5, 5, 15 + width, 10 + self.HUD_LINE * len(lines), 0.6)
+        for i, line in enumerate(lines):
+            cv2.putText(image, line, (10, 5 + self.HUD_LINE * (i + 1) - 4), self.HUD_FONT, self.HUD_SCALE,
+                        (255, 255, 255), 1, cv2.LINE_AA)
+
+    def render(self, image: np.ndarray, text: str, now: float = None, hud: dict = None) -> np.ndarray:
+        """레이블/안내 텍스트 + (설정 시) FPS, HUD 를 image 에 제자리 합성하고 image 반환"""
+        if now is not None:
+            self.tick(now)
+        self.text.draw(image, text, self.label_pos, self.label_size)
+        if self.show_fps:
+            self.draw_fps(image)
+        if self.show_hud and hud:
+            self.draw_hud(image, hud)
+        return image
+
 
 def putText_korean(image, text, pos, font_path, font_size, color):
     img_pil = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGBA))  # RGBA 모드로 변경
@@ -32,3 +269,56 @@ def putText_korean(image, text, pos, font_path, font_size, color):
     draw.text(pos, text, font=font, fill=text_color_rgba)
 
     return cv2.cvtColor(np.array(img_pil), cv2.COLOR_RGBA2BGR)
+
+
+if __name__ == "__main__":
+    # 오버레이 벤치마크: putText_korean(프레임 전체 변환) vs OverlayRenderer(영역만 합성)
+    # (실행: python -m ui.visualizer [폰트 파일 경로])
+    import sys
+    import time
+
+    font_path = sys.argv[1] if len(sys.argv) > 1 else FONT_PATH
+    FONT_PATH = font_path  # putText_korean 은 모듈 전역 FONT_PATH 를 사용
+    frame = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    texts = ["인식 중...", "손을 보여주세요", "ㄱ"]
+
+    def bench(draw, repeats=200):
+        times = np.empty(repeats)
+        for i in range(repeats):
+            image = frame.copy()
+            start = time.perf_counter()
+            draw(image, texts[i % len(texts)])
+            times[i] = time.perf_counter() - start
+        times *= 1000
+        return np.percentile(times, 50), np.percentile(times, 99)
+
+    overlay = OverlayRenderer(font_path)
+    hud_overlay = OverlayRenderer(font_path, show_fps=True, show_hud=True)
+    hud = {'frames': 1234, 'predict_calls': 987, 'speed': 0.42, 'cache_hit_rate': 0.61}
+    same = all(np.array_equal(putText_korean(frame.copy(), text, (50, 420), font_path, 40, (0, 0, 0)),
+                              overlay.render(frame.copy(), text)) for text in texts)
+    print(f"putText_korean 과 결과 일치: {same}")
+    results = [("putText_korean", bench(lambda image, text: putText_korean(image, text, (50, 420), font_path, 40, (0, 0, 0)))),
+               ("OverlayRenderer", bench(lambda image, text: overlay.render(image, text))),
+               ("+ FPS/HUD", bench(lambda image, text: hud_overlay.render(image, text, time.perf_counter(), hud)))]
+    for name, (p50, p99) in results:
+        print(f"{name:<16}: p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+
+    # 손 골격: mediapipe draw_landmarks (설치되어 있으면) vs SkeletonRenderer, 두 손
+    landmarks = (0.3 + 0.4 * np.random.default_rng(1).random((2, 21, 3))).astype(np.float32)
+    present = np.ones(2, dtype=bool)
+    skeleton = SkeletonRenderer()
+    p50, p99 = bench(lambda image, text: skeleton.draw(image, landmarks, present))
+    print(f"{'SkeletonRenderer':<16}: p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+    try:
+        import mediapipe as mp
+        from mediapipe.framework.formats import landmark_pb2
+        hands = [landmark_pb2.NormalizedLandmarkList(landmark=[landmark_pb2.NormalizedLandmark(x=x, y=y, z=z)
+                                                                for x, y, z in hand]) for hand in landmarks]
+        def draw_landmarks(image, text):
+            for hand in hands:
+                mp.solutions.drawing_utils.draw_landmarks(image, hand, mp.solutions.hands.HAND_CONNECTIONS)
+        p50, p99 = bench(draw_landmarks)
+        print(f"{'draw_landmarks':<16}: p50 {p50:.3f} ms, p99 {p99:.3f} ms")
+    except ImportError:
+        print("mediapipe 가 없어 draw_landmarks 비교는 건너뜀")
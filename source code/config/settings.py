@@ -6,8 +6,29 @@ REOPEN_INTERVAL_SEC = 1.0
 READ_FAIL_SLEEP_SEC = 0.3
 
 # 인식 설정 -> engine/gesture_recognizer.py & ui/video_thread.py & ui/ui_app.py
-REC_HISTORY_LEN = 5
-REC_COOL_TIME = 3.0
+# 추가 인식 단계는 실제 녹화 데이터로 임계값을 조정하기 전까지 기본 꺼짐
+# (기본값 = 기존 동작: REC_HISTORY_LEN 프레임 연속 동일 판정 + 고정 쿨다운)
+REC_HISTORY_LEN = 5         # 확정에 필요한 최대(상한) 연속 프레임 수
+REC_STABILIZER = "run_length" # 안정화 방식: 'run_length'(N프레임 연속 동일) | 'ema'(확률 평균 + 마진) | 'adaptive'(확신도별 프레임 수)
+REC_EMA_ALPHA = 0.5         # [ema] EMA 가중치
+REC_COMMIT_MARGIN = 0.4     # [ema] 평균 확률 1위-2위 차이가 이 이상이면 REC_HISTORY_LEN 전에 확정
+REC_MIN_COMMIT_FRAMES = 2   # [ema/adaptive] 확정에 필요한 최소(하한) 연속 프레임 수
+REC_CONF_LOW = 0.5          # [adaptive] 평균 확신도가 이 이하면 REC_HISTORY_LEN 프레임 필요
+REC_CONF_HIGH = 0.9         # [adaptive] 평균 확신도가 이 이상이면 REC_MIN_COMMIT_FRAMES 프레임 필요
+REC_COOL_TIME = 3.0         # 확정 후 다음 확정까지 대기 시간(초). 전환 감지 모드에서는 상한
+REC_TRANSITION_MODE = False # 손 자세 변화/손 이탈 시 쿨다운 전에 바로 재무장
+REC_CHANGE_THRESHOLD = 0.35 # 재무장에 필요한 자세 변화량 (손바닥 길이 대비 평균 관절 이동 거리)
+REC_HOLD_GATING = False     # 손이 멈춰 자세를 유지할 때만 예측 (이동 중 프레임은 건너뜀)
+REC_HOLD_SPEED = 2.0        # 자세 유지로 판단하는 최대 손 움직임 속도 (손바닥 길이/초)
+REC_LANDMARK_FILTER = False # 특징 추출 전 랜드마크 One-Euro 필터 적용
+REC_FILTER_MIN_CUTOFF = 1.0 # [필터] 정지 상태 cutoff(Hz). 낮을수록 떨림 감소, 지연 증가
+REC_FILTER_BETA = 20.0      # [필터] 움직임 속도에 따른 cutoff 증가량. 클수록 빠른 움직임 지연 감소
+REC_PREDICTION_CACHE = 0    # 거의 같은 특징 벡터의 예측 확률 캐시 크기 (0이면 사용 안 함)
 DISPLAY_DURATION = 3.0
 SHOW_LANDMARKS = True
+SHOW_FPS = False            # 화면 오른쪽 위 FPS 표시
+SHOW_DEBUG_HUD = False      # 화면 왼쪽 위 디버그 HUD (처리 통계, 안정화 프레임 수, 손 움직임 속도)
+DISPLAY_SCALE_IN_THREAD = True   # 화면 크기 맞춤(축소/확대)을 영상 스레드에서 처리 (GUI 스레드 부담 감소)
+DISPLAY_SMOOTH_SCALING = False   # GUI 스레드에서 크기를 맞출 때 부드러운 보간 사용 (False: 빠른 보간)
+VIDEO_WIDGET = "label"           # 카메라 화면: 'label'(QLabel, 오버레이를 프레임에 그림) | 'opengl'(QOpenGLWidget, 텍스처 업로드 + GPU 크기 조정 + 벡터 오버레이). 사용할 수 없으면 'label'
 CONFIDENCE_THRESHOLD = 0.5
\ No newline at end of file
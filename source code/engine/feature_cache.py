@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""훈련용 특징 행렬 캐시: 데이터셋 + 특징 추출 코드가 바뀌지 않았으면 전처리를 건너뜀"""
+import hashlib
+import os
+
+import numpy as np
+from sklearn.preprocessing import LabelEncoder
+
+from engine import features
+
+_HASH_BLOCK = 1 << 20
+
+
+def _update_with_file(h, path):
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b''):
+            h.update(block)
+
+def feature_cache_key(dataset_file) -> str:
+    """
+    데이터셋 내용(CSV 파일 또는 바이너리 디렉터리의 파일들)과
+    특징 추출 코드(engine/features.py)의 해시로 캐시 키 생성
+    """
+    h = hashlib.sha256()
+    if os.path.isdir(dataset_file):
+        for name in sorted(os.listdir(dataset_file)):
+            h.update(name.encode('utf-8'))
+            _update_with_file(h, os.path.join(dataset_file, name))
+    else:
+        _update_with_file(h, dataset_file)
+    _update_with_file(h, features.__file__)
+    return h.hexdigest()
+
+def load_feature_cache(cache_file, key):
+    """
+    캐시가 존재하고 키가 일치하면 (특징 행렬, 인코딩된 라벨, LabelEncoder) 반환.
+    없거나 키가 다르거나 읽기에 실패하면 None 반환.
+    """
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        with np.load(cache_file) as cache:
+            if str(cache['key']) != key:
+                return None
+            X, y = cache['features'], cache['labels']
+            encoder = LabelEncoder()
+            encoder.classes_ = cache['classes']
+    except Exception as e:
+        print(f"특징 캐시 로드 실패 (재생성합니다): {e}")
+        return None
+    return X, y, encoder
+
+def save_feature_cache(cache_file, key, X, y, encoder):
+    """특징 행렬/라벨/클래스 목록을 키와 함께 저장 (임시 파일에 쓴 뒤 교체)"""
+    os.makedirs(os.path.dirname(os.path.abspath(cache_file)), exist_ok=True)
+    tmp_file = f"{cache_file}.tmp"
+    with open(tmp_file, 'wb') as f:
+        np.savez(f, key=np.array(key), features=X, labels=y, classes=encoder.classes_)
+    os.replace(tmp_file, cache_file)
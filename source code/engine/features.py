@@ -1,25 +1,245 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 
+# 관절 벡터(v2 - v1) 계산용 인덱스
+_V1_IDX = [0,1,2,3,0,5,6,7,0,9,10,11,0,13,14,15,0,17,18,19]
+_V2_IDX = [1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20]
+# 각도 계산에 사용하는 인접 벡터 쌍
+_ANGLE_A = [0,1,2,4,5,6,8,9,10,12,13,14,16,17,18]
+_ANGLE_B = [1,2,3,5,6,7,9,10,11,13,14,15,17,18,19]
+# 엄지 끝(4)과 나머지 손가락 끝 사이 거리
+_TIP_IDX = [8, 12, 16, 20]
+
+# 특징 벡터 크기: (각도 15 + 좌표 60 + 거리 4 + 방향 6) x 두 손
+NUM_FEATURES = 170
+# 랜드마크 -> 특징 -> 분류기 입력까지 유지하는 dtype (RandomForest 내부 dtype과 동일해 변환 복사가 없음)
+FEATURE_DTYPE = np.float32
+
+
 def calculate_angles(joint: np.ndarray) -> np.ndarray:
-    v1 = joint[[0,1,2,3,0,5,6,7,0,9,10,11,0,13,14,15,0,17,18,19], :]
-    v2 = joint[[1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20], :]
+    joint = np.asarray(joint, dtype=FEATURE_DTYPE)
+    v1 = joint[_V1_IDX, :]
+    v2 = joint[_V2_IDX, :]
     v = v2 - v1
     v = v / np.linalg.norm(v, axis=1)[:, np.newaxis]
     return np.degrees(np.arccos(np.einsum('nt,nt->n',
-                     v[[0,1,2,4,5,6,8,9,10,12,13,14,16,17,18], :],
-                     v[[1,2,3,5,6,7,9,10,11,13,14,15,17,18,19], :] ))).astype(np.float32)
+                     v[_ANGLE_A, :],
+                     v[_ANGLE_B, :] ))).astype(FEATURE_DTYPE, copy=False)
 
 def calculate_distances(joint: np.ndarray) -> np.ndarray:
+    joint = np.asarray(joint, dtype=FEATURE_DTYPE)
     thumb_tip = joint[4]
-    other_tips = joint[[8, 12, 16, 20]]
+    other_tips = joint[_TIP_IDX]
     distances = np.linalg.norm(other_tips - thumb_tip, axis=1)
-    return distances.astype(np.float32)
+    return distances.astype(FEATURE_DTYPE, copy=False)
 
 def calculate_orientation_vectors(joint: np.ndarray) -> np.ndarray:
+    joint = np.asarray(joint, dtype=FEATURE_DTYPE)
     v_direction = joint[9] - joint[0]
-    v_direction = np.zeros(3) if np.linalg.norm(v_direction) == 0 else v_direction / np.linalg.norm(v_direction)
+    v_direction = np.zeros(3, dtype=FEATURE_DTYPE) if np.linalg.norm(v_direction) == 0 else v_direction / np.linalg.norm(v_direction)
     v1, v2 = joint[5] - joint[0], joint[17] - joint[0]
     v_normal = np.cross(v1, v2)
-    v_normal = np.zeros(3) if np.linalg.norm(v_normal) == 0 else v_normal / np.linalg.norm(v_normal)
-    return np.concatenate([v_direction, v_normal]).astype(np.float32)
+    v_normal = np.zeros(3, dtype=FEATURE_DTYPE) if np.linalg.norm(v_normal) == 0 else v_normal / np.linalg.norm(v_normal)
+    return np.concatenate([v_direction, v_normal])
+
+
+def _safe_normalize(v: np.ndarray) -> np.ndarray:
+    """마지막 축 기준 단위 벡터화. 길이가 0이면 0 벡터 반환"""
+    norm = np.linalg.norm(v, axis=-1, keepdims=True)
+    return np.divide(v, norm, out=np.zeros_like(v), where=norm != 0)
+
+def hand_feature_index(hand: int) -> np.ndarray:
+    """한 손(0=왼손, 1=오른손)의 특징 열 인덱스 (각도 15 + 좌표 60 + 거리 4 + 방향 6 = 85개)"""
+    return np.concatenate([np.arange(hand * 15, (hand + 1) * 15),
+                           np.arange(30 + hand * 60, 30 + (hand + 1) * 60),
+                           np.arange(150 + hand * 4, 150 + (hand + 1) * 4),
+                           np.arange(158 + hand * 6, 158 + (hand + 1) * 6)])
+
+def hand_presence(features: np.ndarray) -> np.ndarray:
+    """
+    특징 행렬 (N, 170)에서 손별 감지 여부 (N, 2) bool 반환.
+    감지된 손은 손목 기준 좌표가 0이 아니므로, 좌표 구간이 모두 0인 손을 감지되지 않은 손으로 봅니다.
+    """
+    features = np.asarray(features)
+    return np.stack([np.any(features[:, 30:90] != 0, axis=1),
+                     np.any(features[:, 90:150] != 0, axis=1)], axis=1)
+
+def extract_features_batch(landmarks: np.ndarray) -> np.ndarray:
+    """
+    여러 샘플의 두 손 랜드마크를 한 번에 특징 행렬로 변환.
+
+    Args:
+        landmarks (np.ndarray): (N, 2, 21, 3) 배열. 두 번째 축은 (왼손, 오른손) 순서.
+                                좌표가 모두 0인 손은 감지되지 않은 손으로 간주.
+    반환: (N, 170) FEATURE_DTYPE(float32) 특징 행렬
+        [왼손 각도, 오른손 각도, 왼손 좌표, 오른손 좌표,
+         왼손 거리, 오른손 거리, 왼손 방향, 오른손 방향] 순서.
+        감지되지 않은 손의 특징은 0으로 채워집니다.
+    """
+    joint = np.asarray(landmarks, dtype=FEATURE_DTYPE)
+    n = joint.shape[0]
+    present = np.any(joint.reshape(n, 2, -1), axis=2)  # (N, 2)
+
+    # 각도 (N, 2, 15): 없는 손은 0 나눗셈 -> NaN 이 되므로 경고를 끄고 아래에서 0으로 마스킹
+    with np.errstate(divide='ignore', invalid='ignore'):
+        v = joint[:, :, _V2_IDX] - joint[:, :, _V1_IDX]
+        v = v / np.linalg.norm(v, axis=3, keepdims=True)
+        angles = np.degrees(np.arccos(np.einsum('nhkt,nhkt->nhk',
+                                                v[:, :, _ANGLE_A], v[:, :, _ANGLE_B])))
+
+    # 손목 기준 상대 좌표 (N, 2, 60)
+    coords = (joint[:, :, 1:] - joint[:, :, :1]).reshape(n, 2, 60)
+    # 엄지 끝 - 손가락 끝 거리 (N, 2, 4)
+    distances = np.linalg.norm(joint[:, :, _TIP_IDX] - joint[:, :, 4:5], axis=3)
+    # 손 방향 / 손바닥 법선 벡터 (N, 2, 6)
+    wrist = joint[:, :, 0]
+    v_direction = _safe_normalize(joint[:, :, 9] - wrist)
+    v_normal = _safe_normalize(np.cross(joint[:, :, 5] - wrist, joint[:, :, 17] - wrist))
+    orientations = np.concatenate([v_direction, v_normal], axis=2)
+
+    # 감지되지 않은 손 마스킹
+    missing = ~present
+    angles[missing] = 0
+    coords[missing] = 0
+    distances[missing] = 0
+    orientations[missing] = 0
+
+    features = np.concatenate([angles.reshape(n, 30), coords.reshape(n, 120),
+                               distances.reshape(n, 8), orientations.reshape(n, 12)], axis=1)
+    return features
+
+
+class FeatureBuilder:
+    """
+    프레임 단위 특징 벡터 생성기.
+    - 미리 할당한 (1, 170) float32 버퍼를 보유하고, 손마다 각도/좌표/거리/방향을 고정된 구간에 직접 기록합니다.
+    - 중간 계산도 모두 미리 할당한 작업 버퍼를 재사용하므로, 매 프레임 특징 계산에 새 배열을 만들지 않습니다.
+    - 결과는 extract_features_batch 와 동일한 순서/값을 가집니다.
+    - feature_index 를 주면(특징 선택으로 학습한 모델) 선택된 특징이 속한 구간(손별 각도/좌표/거리/방향)만 계산하고,
+      vector() 가 선택된 열만 모은 (1, k) 벡터를 반환합니다.
+    """
+    def __init__(self, feature_index: np.ndarray = None):
+        """
+        Args:
+            feature_index : 모델 입력 특징 열 인덱스 (None 이면 170개 전체)
+            self.buffer   : 170개 전체 특징 버퍼 (1, 170). 특징 선택이 없으면 그대로 모델 입력으로 사용
+            self._hands   : 손별(0=왼손, 1=오른손) 버퍼 구간 view (각도, 좌표, 거리, 방향)
+            self._needed  : 손별 각 구간 계산 여부 (각도, 좌표, 거리, 방향)
+        """
+        self.buffer = np.zeros((1, NUM_FEATURES), dtype=FEATURE_DTYPE)
+        vec = self.buffer[0]
+        self._hands = []
+        for hand in (0, 1):
+            angles = vec[hand * 15:(hand + 1) * 15]
+            coords = vec[30 + hand * 60:30 + (hand + 1) * 60].reshape(20, 3)
+            distances = vec[150 + hand * 4:150 + (hand + 1) * 4]
+            orientations = vec[158 + hand * 6:158 + (hand + 1) * 6]
+            self._hands.append((angles, coords, distances, orientations))
+
+        # 특징 선택: 선택된 열이 하나라도 있는 구간만 계산
+        if feature_index is None:
+            self.feature_index = None
+            self._selected = self.buffer
+            self._needed = [(True, True, True, True)] * 2
+        else:
+            self.feature_index = np.asarray(feature_index, dtype=np.intp)
+            self._selected = np.zeros((1, len(self.feature_index)), dtype=FEATURE_DTYPE)
+            used = np.zeros(NUM_FEATURES, dtype=bool)
+            used[self.feature_index] = True
+            self._needed = [tuple(bool(used[start:end].any()) for start, end in
+                                  ((hand * 15, (hand + 1) * 15),
+                                   (30 + hand * 60, 30 + (hand + 1) * 60),
+                                   (150 + hand * 4, 150 + (hand + 1) * 4),
+                                   (158 + hand * 6, 158 + (hand + 1) * 6)))
+                            for hand in (0, 1)]
+
+        # 인덱스 배열 (np.take 용)
+        self._v1_idx = np.array(_V1_IDX, dtype=np.intp)
+        self._v2_idx = np.array(_V2_IDX, dtype=np.intp)
+        self._angle_a = np.array(_ANGLE_A, dtype=np.intp)
+        self._angle_b = np.array(_ANGLE_B, dtype=np.intp)
+        self._tip_idx = np.array(_TIP_IDX, dtype=np.intp)
+
+        # 작업 버퍼
+        self._joint = np.empty((21, 3), dtype=FEATURE_DTYPE)
+        self._v = np.empty((20, 3), dtype=FEATURE_DTYPE)
+        self._v_tmp = np.empty((20, 3), dtype=FEATURE_DTYPE)
+        self._v_norm = np.empty((20, 1), dtype=FEATURE_DTYPE)
+        self._va = np.empty((15, 3), dtype=FEATURE_DTYPE)
+        self._vb = np.empty((15, 3), dtype=FEATURE_DTYPE)
+        self._tips = np.empty((4, 3), dtype=FEATURE_DTYPE)
+        self._e1 = np.empty(3, dtype=FEATURE_DTYPE)
+        self._e2 = np.empty(3, dtype=FEATURE_DTYPE)
+
+    def reset(self):
+        """모든 손의 특징을 0으로 초기화 (프레임 시작 시 호출)"""
+        self.buffer.fill(0)
+
+    def set_hand(self, hand: int, joint: np.ndarray):
+        """
+        한 손의 랜드마크 (21, 3)로 특징을 계산해 버퍼의 해당 구간에 기록.
+        hand: 0=왼손, 1=오른손 (joint 가 float64 여도 작업 버퍼에 복사하면서 FEATURE_DTYPE 으로 변환)
+        """
+        angles, coords, distances, orientations = self._hands[hand]
+        need_angles, need_coords, need_distances, need_orientations = self._needed[hand]
+        j = self._joint
+        np.copyto(j, joint)
+
+        # 각도: 관절 벡터 정규화 후 인접 벡터 사이 각
+        if need_angles:
+            np.take(j, self._v2_idx, axis=0, out=self._v)
+            np.take(j, self._v1_idx, axis=0, out=self._v_tmp)
+            np.subtract(self._v, self._v_tmp, out=self._v)
+            np.einsum('nt,nt->n', self._v, self._v, out=self._v_norm[:, 0])
+            np.sqrt(self._v_norm, out=self._v_norm)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                np.divide(self._v, self._v_norm, out=self._v)
+                np.take(self._v, self._angle_a, axis=0, out=self._va)
+                np.take(self._v, self._angle_b, axis=0, out=self._vb)
+                np.einsum('nt,nt->n', self._va, self._vb, out=angles)
+                np.arccos(angles, out=angles)
+            np.degrees(angles, out=angles)
+
+        # 손목 기준 상대 좌표
+        if need_coords:
+            np.subtract(j[1:], j[0], out=coords)
+
+        # 엄지 끝 - 손가락 끝 거리
+        if need_distances:
+            np.take(j, self._tip_idx, axis=0, out=self._tips)
+            np.subtract(self._tips, j[4], out=self._tips)
+            np.einsum('nt,nt->n', self._tips, self._tips, out=distances)
+            np.sqrt(distances, out=distances)
+
+        if need_orientations:
+            # 손 방향 벡터
+            direction, normal = orientations[:3], orientations[3:]
+            np.subtract(j[9], j[0], out=direction)
+            self._normalize(direction)
+
+            # 손바닥 법선 벡터 (검지 뿌리 x 새끼 뿌리)
+            e1, e2 = self._e1, self._e2
+            np.subtract(j[5], j[0], out=e1)
+            np.subtract(j[17], j[0], out=e2)
+            normal[0] = e1[1] * e2[2] - e1[2] * e2[1]
+            normal[1] = e1[2] * e2[0] - e1[0] * e2[2]
+            normal[2] = e1[0] * e2[1] - e1[1] * e2[0]
+            self._normalize(normal)
+
+    def vector(self) -> np.ndarray:
+        """
+        모델 입력 벡터 반환 (set_hand 후 호출).
+        특징 선택이 없으면 self.buffer (1, 170), 있으면 선택된 열만 모은 (1, k) 버퍼 (재사용).
+        """
+        if self.feature_index is not None:
+            np.take(self.buffer, self.feature_index, axis=1, out=self._selected)
+        return self._selected
+
+    @staticmethod
+    def _normalize(v: np.ndarray):
+        """v 를 제자리에서 단위 벡터화. 길이가 0이면 0 벡터로 둠"""
+        norm = np.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
+        if norm == 0:
+            v.fill(0)
+        else:
+            np.divide(v, norm, out=v)
@@ -2,13 +2,19 @@
     모듈화한 파일"""
 
 import time
-from collections import deque
 import numpy as np
 import cv2
 import mediapipe as mp
 
-from engine.features import calculate_angles, calculate_distances, calculate_orientation_vectors
-from ui.visualizer import putText_korean
+from engine.features import FeatureBuilder
+from engine.landmark_converter import LandmarkConverter
+from engine.flat_forest import flatten_model
+from engine.inference import model_feature_index
+from engine.stabilizer import Stabilizer, RunLengthStabilizer
+from engine.motion import TransitionGate, MotionEstimator
+from engine.landmark_filter import LandmarkFilter
+from engine.prediction_cache import PredictionCache
+from ui.visualizer import OverlayRenderer, SkeletonRenderer
 from config.paths import FONT_PATH
 
 
@@ -17,52 +23,122 @@ class GestureRecognizer:
     Mediapipe 기반 프레임 인식 담당.
     - Mediapipe Hands 인스턴스를 보유하고 multi_hand_landmarks를 처리합니다.
     - 모델 + encoder를 입력으로 받아 예측을 수행합니다.
-    - 안정화(최근 N개 동일 판정) + 쿨다운 로직을 포함합니다.
-    - 원본 video_thread.py의 손 랜드마크 -> features 계산 -> 예측 -> 히스토리/쿨다운 -> putText_korean 시각화 흐름을 옮겨왔습니다.
+    - 안정화(engine/stabilizer.py, 기본: 최근 N개 동일 판정) + 쿨다운 로직을 포함합니다.
+    - 원본 video_thread.py의 손 랜드마크 -> features 계산 -> 예측 -> 히스토리/쿨다운 -> 한글 텍스트 시각화 흐름을 옮겨왔습니다.
     """
     def __init__(self, model, encoder,
                  rec_history_len: int,
                  rec_cool_time: float,
                  display_duration: float,
                  show_landmarks: bool,
-                 conf_thres: float):
+                 conf_thres: float,
+                 stabilizer: Stabilizer = None,
+                 transition_threshold: float = None,
+                 hold_speed: float = None,
+                 landmark_filter: LandmarkFilter = None,
+                 prediction_cache_size: int = 0,
+                 show_fps: bool = False,
+                 show_hud: bool = False,
+                 vector_overlay: bool = False):
         """
         Args:
             self.camera_index(int) : 카메라 장치의 인덱스. Defaults to 0.
             self.mp_hands          : mediapipe hands 모듈
-            self.mp_drawing        : mediapipe drawing_utils 모듈(랜드마크 시각화용)
             self.hands             : mediapipe Hands 객체(손 인식을 위한 메인 객체)
-            self.history           : 최근 인식 결과를 저장하는 deque(안정화용)
+            self.label_table       : 확률 벡터 인덱스 -> 레이블 문자열 표 (로드 시 한 번만 변환)
+            self.stabilizer        : 프레임별 확률 벡터로 확정 후보를 고르는 안정화기 (기본: RunLengthStabilizer)
             self.last_rec_time     : 마지막 인식 확정 시각(쿨다운용)
             self.rec_cool_time     : 인식 쿨다운 시간(초) (레이블 확정 후 다음 확정까지 대기 시간)
+                                     전환 감지 모드에서는 최대 대기 시간(상한)으로만 사용
+            self.transition_gate   : 손 자세 변화/손 이탈 시 바로 재무장하는 TransitionGate
+                                     (transition_threshold 가 None 이면 사용하지 않고 고정 쿨다운만 적용)
+            self.motion_estimator  : 손 움직임 속도 추정기. 움직이는 동안은 특징 추출/예측을 건너뜀
+                                     (hold_speed 가 None 이면 매 프레임 예측)
+            self.stats             : 처리 통계 (프레임 수, 예측 호출 수, 움직임으로 건너뛴 프레임 수) -> get_stats()
             self.display_duration  : 확정된 레이블이 화면에 표시되는 시간(초)
             self.last_rec_label    : 마지막으로 확정된 레이블
+            self.last_commit_frames: 마지막 확정까지 걸린 연속 프레임 수
             self.display_label     : 화면에 표시될 레이블
             self.display_start_time: 레이블(display_label)이 화면에 표시되기 시작한 시각
             self.show_landmarks    : 랜드마크 시각화 여부 설정 (기본값: True)
+            self.landmark_converter: Mediapipe 결과 -> 랜드마크 버퍼 변환기(LandmarkConverter, 재사용)
+            self.landmark_filter   : 특징 추출 전 랜드마크 떨림 제거 필터 (None 이면 원본 랜드마크 사용)
+            self.feature_builder   : 프레임별 특징 벡터 버퍼(FeatureBuilder, 재사용. 모델의 선택된 특징만 계산)
+            self.skeleton_renderer : 손 랜드마크 골격 렌더러 (show_landmarks 시 사용)
+            self.overlay           : 화면 오버레이 (레이블/안내 텍스트, show_fps 시 FPS, show_hud 시 디버그 HUD).
+                                     모두 프레임의 해당 영역만 제자리 합성
+            self.vector_overlay    : True 이면 골격/텍스트를 프레임에 그리지 않고 self.last_overlay 로만 전달
+                                     (OpenGL 화면이 벡터로 그림, ui/gl_video_widget.py)
+            self.last_overlay      : [vector_overlay] 마지막 프레임의 오버레이 항목
+                                     {'landmarks': (2, 21, 2) 정규화 좌표 또는 None, 'present', 'text', 'fps', 'hud'}
+            self.predictor         : 프레임별 예측기 (FlatForest, 하위 모델을 평탄화한 HandCascade 또는 원본 모델,
+                                     prediction_cache_size > 0 이면 PredictionCache 로 감쌈)
         """
         self.model = model
         self.encoder = encoder
+        # 특징 선택으로 학습한 모델이면 선택된 특징만 계산 (None: 170개 전체)
+        feature_index = model_feature_index(model)
+        # 평탄화 가능한 포레스트면 NumPy 예측기 사용, 아니면 모델 그대로 사용
+        self.predictor = flatten_model(model) or model
+        # 자세를 유지하는 동안 거의 같은 특징 벡터는 이전 확률 재사용
+        if prediction_cache_size > 0:
+            self.predictor = PredictionCache(self.predictor, max_size=prediction_cache_size,
+                                             feature_index=feature_index)
+        # 매 프레임 inverse_transform 대신 인덱싱으로 레이블 변환 (predict_proba 열 순서 기준)
+        self.label_table = tuple(str(encoder.classes_[c]) for c in self.predictor.classes_)
         
         self.mp_hands = mp.solutions.hands
-        self.mp_drawing = mp.solutions.drawing_utils
         
         self.hands = self.mp_hands.Hands(max_num_hands = 2,
                                          min_detection_confidence = conf_thres,
                                          min_tracking_confidence = conf_thres)
-        self.history = deque(maxlen=rec_history_len)
+        self.stabilizer = stabilizer if stabilizer is not None else RunLengthStabilizer(rec_history_len)
         self.last_rec_time = 0.0
         self.rec_cool_time = rec_cool_time
+        self.transition_gate = TransitionGate(transition_threshold) if transition_threshold is not None else None
+        self.motion_estimator = MotionEstimator(hold_speed) if hold_speed is not None else None
+        self.stats = {'frames': 0, 'predict_calls': 0, 'motion_skips': 0}
         self.display_duration = display_duration
         self.last_rec_label = ""
+        self.last_commit_frames = 0
         self.display_start_time = None
         self.show_landmarks = show_landmarks
+        self.landmark_converter = LandmarkConverter()
+        self.landmark_filter = landmark_filter
+        self.feature_builder = FeatureBuilder(feature_index)
+        self.skeleton_renderer = SkeletonRenderer()
+        self.overlay = OverlayRenderer(FONT_PATH, show_fps=show_fps, show_hud=show_hud)
+        self.vector_overlay = vector_overlay
+        self.last_overlay = None
         
         
     def set_show_landmarks(self, flag: bool):
         """ 랜드마크 시각화 여부 설정 """
         self.show_landmarks = flag
         
+    def get_stats(self) -> dict:
+        """ 처리 통계 반환 (예측 캐시 사용 시 적중 횟수/적중률 포함) """
+        stats = dict(self.stats)
+        if isinstance(self.predictor, PredictionCache):
+            stats['cache_hits'] = self.predictor.hits
+            stats['cache_misses'] = self.predictor.misses
+            stats['cache_hit_rate'] = self.predictor.hit_rate
+        return stats
+        
+    def _hud(self) -> dict:
+        """ 디버그 HUD 항목: 처리 통계 + 안정화 연속 프레임 수 + 손 움직임 속도 """
+        hud = self.get_stats()
+        hud['run'] = self.stabilizer.run
+        if self.motion_estimator is not None:
+            hud['speed'] = self.motion_estimator.speed
+        return hud
+        
+    def _is_armed(self, current_time: float) -> bool:
+        """ 다음 확정 가능 여부: 쿨다운 경과(상한) 또는 전환 감지로 재무장 """
+        if (current_time - self.last_rec_time) > self.rec_cool_time:
+            return True
+        return self.transition_gate is not None and self.transition_gate.armed
+        
     def close(self):
         """ Mediapipe 자원 해제 """
         try:
@@ -91,74 +167,83 @@ class GestureRecognizer:
         hands_present = False
         
         
-        # 초기값
-        init_zeros = {
-            'angles': np.zeros(15, dtype=np.float32),
-            'coords': np.zeros(60, dtype=np.float32),
-            'distances': np.zeros(4, dtype=np.float32),
-            'orientations': np.zeros(6, dtype=np.float32)
-        }
-        
-        lh_features = init_zeros.copy()
-        rh_features = init_zeros.copy()
         mapped_label_to_emit = None
+        skeleton = None
+        self.stats['frames'] += 1
     
         # Mediapipe 처리
         results = self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
         if results.multi_hand_landmarks:
             hands_present = True
-            for i, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                if self.show_landmarks:
-                    try:
-                        self.mp_drawing.draw_landmarks(frame,
-                                                       hand_landmarks,
-                                                       self.mp_hands.HAND_CONNECTIONS)
-                    except Exception:
-                        pass
-                    
-                handedness = results.multi_handedness[i].classification[0].label
-                joint = np.array([[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark])
-                
-                features = {
-                    'angles': calculate_angles(joint),
-                    'coords': (joint[1:] - joint[0]).flatten(),  # 기준점(손목) 보정
-                    'distances': calculate_distances(joint),
-                    'orientations': calculate_orientation_vectors(joint)
-                }
-                if handedness == 'Left':
-                    lh_features = features
-                elif handedness == 'Right':
-                    rh_features = features
+            # 랜드마크 -> (2, 21, 3) float32 버퍼 ([왼손, 오른손])
+            landmarks = self.landmark_converter.convert(results)
+            present = self.landmark_converter.present
+            if self.show_landmarks and self.vector_overlay:
+                # 골격은 화면 위젯이 그림 (변환 버퍼는 다음 프레임에 재사용되므로 복사)
+                skeleton = (landmarks[:, :, :2].copy(), present.copy())
+            elif self.show_landmarks:
+                try:
+                    # 두 손 골격을 한 번에 그림 (필터 적용 전 원본 랜드마크)
+                    self.skeleton_renderer.draw(frame, landmarks, present)
+                except Exception:
+                    pass
                     
-            # 특징 벡터 구성
-            feature_vector = np.concatenate([
-                lh_features['angles'], rh_features['angles'],
-                lh_features['coords'], rh_features['coords'],
-                lh_features['distances'], rh_features['distances'],
-                lh_features['orientations'], rh_features['orientations']
-            ]).reshape(1, -1).astype(np.float32)
+            if self.landmark_filter is not None:
+                landmarks = self.landmark_filter.apply(landmarks, present, current_time)
             
-            try:
-                prediction = self.model.predict(feature_vector)
-                predicted_label = self.encoder.inverse_transform(prediction)[0]
-            except Exception:
-                predicted_label = None
+            # 전환 감지: 확정 이후 자세가 충분히 바뀌면 재무장하고 새 자세로 다시 안정화
+            if self.transition_gate is not None and self.transition_gate.update(landmarks, present):
+                self.stabilizer.reset()
                 
-            if predicted_label:
-                self.history.append(predicted_label)
+            # 자세 유지 판정: 글자 사이를 이동 중인 프레임은 특징 추출/예측을 건너뜀
+            holding = self.motion_estimator is None or self.motion_estimator.update(landmarks, present, current_time)
+            proba = None
+            if holding:
+                # 특징 벡터 (미리 할당된 버퍼를 그대로 모델 입력으로 사용, 감지되지 않은 손은 0,
+                # 특징 선택 모델이면 선택된 특징만 계산)
+                self.feature_builder.reset()
+                for hand in (0, 1):
+                    if present[hand]:
+                        self.feature_builder.set_hand(hand, landmarks[hand])
+                feature_vector = self.feature_builder.vector()
                 
-            # 안정화: 최근 N개(history 길이) 동일 판정
-            if len(self.history) == self.history.maxlen and len(set(self.history)) == 1:
-                if (current_time - self.last_rec_time) > self.rec_cool_time:
+                try:
+                    self.stats['predict_calls'] += 1
+                    proba = self.predictor.predict_proba(feature_vector)[0]
+                    # 캐스케이드에 현재 손 구성 모델이 없으면 확률이 모두 0 -> 예측 없음으로 처리
+                    if not proba.any():
+                        proba = None
+                except Exception:
+                    proba = None
+            else:
+                self.stats['motion_skips'] += 1
+                
+            # 안정화: 확정 후보가 나오고 쿨다운이 지났거나(상한) 재무장되었으면 확정
+            candidate = self.stabilizer.update(proba) if proba is not None else None
+            if candidate is not None:
+                if self._is_armed(current_time):
                     
-                    mapped_label_to_emit = self.history[-1]
+                    mapped_label_to_emit = self.label_table[candidate]
                     
                     self.last_rec_label = mapped_label_to_emit
                     self.display_label = mapped_label_to_emit
                     
                     self.display_start_time = current_time
                     self.last_rec_time = current_time
-                    self.history.clear()
+                    self.last_commit_frames = self.stabilizer.run
+                    print(f"인식 확정: {mapped_label_to_emit} ({self.last_commit_frames}프레임)")
+                    self.stabilizer.reset()
+                    if self.transition_gate is not None:
+                        self.transition_gate.commit(landmarks, present)
+                    
+        else:
+            if self.landmark_filter is not None:
+                self.landmark_filter.reset()
+            if self.motion_estimator is not None:
+                self.motion_estimator.reset()
+            if self.transition_gate is not None and self.transition_gate.update(None, None):
+                # 손이 화면에서 사라지면 재무장 (같은 글자 반복 입력)
+                self.stabilizer.reset()
                     
         # 표시할 텍스트 결정
         if hands_present:
@@ -170,10 +255,20 @@ class GestureRecognizer:
             display_text = guide_text
             self.display_start_time = None  # 손이 없으면 표시 시간 초기화
         
-        # 텍스트 시각화
+        if self.vector_overlay:
+            # 프레임은 그대로 두고 오버레이 항목만 전달
+            self.overlay.tick(current_time)
+            self.last_overlay = {'landmarks': skeleton[0] if skeleton else None,
+                                 'present': skeleton[1] if skeleton else None,
+                                 'text': display_text,
+                                 'fps': self.overlay.fps if self.overlay.show_fps else None,
+                                 'hud': self._hud() if self.overlay.show_hud else None}
+            return frame, mapped_label_to_emit
+
+        # 텍스트 시각화 (폰트/텍스트 스프라이트를 캐시하고 오버레이 영역만 합성, putText_korean 과 같은 모양)
         try:
-            #frame = putText_korean(frame, display_text, (50, 420), str(FONT_PATH), 1.0, (0, 0, 0), 2, cv2.LINE_AA)
-            frame = putText_korean(frame, display_text, (50, 420), FONT_PATH, 40, (0, 0, 0))
+            hud = self._hud() if self.overlay.show_hud else None
+            frame = self.overlay.render(frame, display_text, current_time, hud)
         except Exception:
             # 실패 시 최소한의 OpenCV putText로 대체
             frame = cv2.putText(frame, display_text, (50, 420), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2, cv2.LINE_AA)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Mediapipe Hands 결과(protobuf 랜드마크) -> NumPy 배열 변환 모듈"""
+from itertools import chain
+from operator import attrgetter
+
+import numpy as np
+
+from engine.features import FEATURE_DTYPE
+
+# handedness 레이블 -> 버퍼 인덱스 (0=왼손, 1=오른손)
+HAND_INDEX = {'Left': 0, 'Right': 1}
+
+_xyz = attrgetter('x', 'y', 'z')
+
+
+class LandmarkConverter:
+    """
+    Mediapipe 결과를 미리 할당한 (2, 21, 3) float32 버퍼에 채우는 변환기.
+    - 손마다 랜드마크 리스트를 한 번만 순회하며 버퍼의 해당 손 위치에 직접 기록합니다.
+    - 감지되지 않은 손은 0으로 남고, self.present 로 감지 여부를 확인할 수 있습니다.
+    """
+    def __init__(self):
+        """
+        Args:
+            self.buffer  : (2, 21, 3) float32 랜드마크 버퍼 ([왼손, 오른손])
+            self.present : (2,) bool 손 감지 여부
+        """
+        self.buffer = np.zeros((2, 21, 3), dtype=FEATURE_DTYPE)
+        self.present = np.zeros(2, dtype=bool)
+        self._flat = self.buffer.reshape(2, 63)
+
+    def convert(self, results) -> np.ndarray:
+        """
+        hands.process() 결과를 버퍼에 채워 반환.
+        반환: self.buffer (호출할 때마다 덮어쓰므로 보관하려면 복사해서 사용)
+        """
+        self.buffer.fill(0)
+        self.present.fill(False)
+        if not results.multi_hand_landmarks:
+            return self.buffer
+
+        for hand_landmarks, handedness in zip(results.multi_hand_landmarks, results.multi_handedness):
+            hand = HAND_INDEX.get(handedness.classification[0].label)
+            if hand is None:
+                continue
+            self._flat[hand] = np.fromiter(chain.from_iterable(map(_xyz, hand_landmarks.landmark)),
+                                           dtype=FEATURE_DTYPE, count=63)
+            self.present[hand] = True
+        return self.buffer
+
+
+if __name__ == "__main__":
+    # 마이크로벤치마크: 기존 리스트 컴프리헨션 방식과 비교 (실행: python -m engine.landmark_converter)
+    import timeit
+    from types import SimpleNamespace
+
+    rng = np.random.default_rng(0)
+    landmark = [SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in rng.random((21, 3))]
+    results = SimpleNamespace(
+        multi_hand_landmarks=[SimpleNamespace(landmark=landmark), SimpleNamespace(landmark=landmark)],
+        multi_handedness=[SimpleNamespace(classification=[SimpleNamespace(label='Left')]),
+                          SimpleNamespace(classification=[SimpleNamespace(label='Right')])])
+
+    def comprehension():
+        for hand_landmarks in results.multi_hand_landmarks:
+            np.array([[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark])
+
+    converter = LandmarkConverter()
+    n = 20000
+    t_old = timeit.timeit(comprehension, number=n) / n * 1e6
+    t_new = timeit.timeit(lambda: converter.convert(results), number=n) / n * 1e6
+    print(f"list comprehension : {t_old:.2f} us/frame (두 손)")
+    print(f"LandmarkConverter  : {t_new:.2f} us/frame (두 손)")
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""손 자세 변화/움직임 측정 모듈 (확정 후 재무장, 자세 유지 판정)"""
+import numpy as np
+
+from engine.features import FEATURE_DTYPE
+
+
+def normalized_pose(landmarks: np.ndarray, present: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    (2, 21, 3) 랜드마크를 손목 기준 좌표로 옮기고 손바닥 길이(손목 -> 중지 뿌리)로 나눈 값을 out 에 기록.
+    손 크기/카메라 거리와 무관하게 자세를 비교하기 위한 정규화. 감지되지 않은 손은 0.
+    """
+    np.subtract(landmarks, landmarks[:, :1], out=out)
+    scale = np.sqrt(np.einsum('ht,ht->h', out[:, 9], out[:, 9]))
+    scale[scale == 0] = 1.0
+    out /= scale[:, np.newaxis, np.newaxis]
+    out[~present] = 0
+    return out
+
+def pose_distance(a: np.ndarray, b: np.ndarray) -> float:
+    """정규화된 두 자세 사이의 손별 평균 관절 이동 거리 중 최댓값"""
+    return float(np.sqrt(((a - b) ** 2).sum(axis=2)).mean(axis=1).max())
+
+
+class TransitionGate:
+    """
+    확정 후 다음 확정을 허용(재무장)할지 판단하는 게이트.
+    - 확정 시점의 손 자세를 기억하고, 자세가 change_threshold 이상 바뀌거나
+      손이 화면에서 사라지면(또는 한 손/두 손 구성이 바뀌면) 즉시 재무장합니다.
+    - 같은 글자를 반복 입력할 때는 손을 잠깐 내리거나 자세를 풀었다가 다시 취하면 됩니다.
+    - 고정 쿨다운(rec_cool_time)은 GestureRecognizer 에서 상한으로만 사용합니다.
+    """
+    def __init__(self, change_threshold: float):
+        """
+        Args:
+            change_threshold (float): 재무장에 필요한 자세 변화량 (손바닥 길이 대비 평균 관절 이동 거리)
+            self.armed              : 확정 가능 상태 여부
+        """
+        self.change_threshold = change_threshold
+        self.armed = True
+        self._anchor = np.zeros((2, 21, 3), dtype=FEATURE_DTYPE)
+        self._anchor_present = np.zeros(2, dtype=bool)
+        self._pose = np.zeros((2, 21, 3), dtype=FEATURE_DTYPE)
+
+    def commit(self, landmarks: np.ndarray, present: np.ndarray):
+        """확정 시 호출: 현재 자세를 기준으로 저장하고 비무장 상태로 전환"""
+        normalized_pose(landmarks, present, self._anchor)
+        self._anchor_present[:] = present
+        self.armed = False
+
+    def update(self, landmarks, present) -> bool:
+        """
+        프레임마다 호출. 손이 없으면 landmarks/present 에 None 전달.
+        반환: 이번 프레임에 재무장되었으면 True
+        """
+        if self.armed:
+            return False
+        if landmarks is None or not np.array_equal(present, self._anchor_present):
+            self.armed = True
+        else:
+            normalized_pose(landmarks, present, self._pose)
+            self.armed = pose_distance(self._pose, self._anchor) >= self.change_threshold
+        return self.armed
+
+
+class MotionEstimator:
+    """
+    프레임 간 손 움직임 속도 추정기 (자세 유지 판정용).
+    - 자세 변화(정규화 자세 거리)와 손목 이동(손바닥 길이 단위) 중 큰 값을 시간으로 나눈 속도를 EMA 로 평활합니다.
+    - 속도가 hold_speed 미만이면 손을 멈추고 자세를 유지하는 중으로 판단합니다.
+    - 손이 새로 나타나거나 한 손/두 손 구성이 바뀐 프레임은 움직이는 중으로 봅니다.
+    """
+    def __init__(self, hold_speed: float, smoothing: float = 0.5):
+        """
+        Args:
+            hold_speed (float) : 자세 유지로 판단하는 최대 속도 (손바닥 길이/초)
+            smoothing (float)  : 속도 EMA 에서 이전 값의 비중
+            self.speed         : 평활된 현재 속도 (손바닥 길이/초)
+        """
+        self.hold_speed = hold_speed
+        self.smoothing = smoothing
+        self.speed = float('inf')
+        self._pose = np.zeros((2, 21, 3), dtype=FEATURE_DTYPE)
+        self._prev_pose = np.zeros((2, 21, 3), dtype=FEATURE_DTYPE)
+        self._prev_wrist = np.zeros((2, 3), dtype=FEATURE_DTYPE)
+        self._prev_present = np.zeros(2, dtype=bool)
+        self._prev_time = None
+
+    def reset(self):
+        """손이 사라졌을 때 호출: 다음 프레임은 움직이는 중으로 시작"""
+        self.speed = float('inf')
+        self._prev_time = None
+
+    def update(self, landmarks: np.ndarray, present: np.ndarray, now: float) -> bool:
+        """
+        현재 프레임 랜드마크로 속도 갱신.
+        반환: 자세를 유지(정지)하고 있으면 True
+        """
+        normalized_pose(landmarks, present, self._pose)
+        if self._prev_time is None or not np.array_equal(present, self._prev_present):
+            self.speed = float('inf')
+        else:
+            dt = max(now - self._prev_time, 1e-3)
+            palm = landmarks[:, 9] - landmarks[:, 0]
+            scale = np.sqrt(np.einsum('ht,ht->h', palm, palm))
+            scale[scale == 0] = 1.0
+            shift = landmarks[:, 0] - self._prev_wrist
+            wrist_shift = np.sqrt(np.einsum('ht,ht->h', shift, shift)) / scale
+            moved = max(pose_distance(self._pose, self._prev_pose), float(wrist_shift[present].max()))
+            speed = moved / dt
+            self.speed = speed if self.speed == float('inf') else self.smoothing * self.speed + (1 - self.smoothing) * speed
+
+        self._pose, self._prev_pose = self._prev_pose, self._pose
+        self._prev_wrist[:] = landmarks[:, 0]
+        self._prev_present[:] = present
+        self._prev_time = now
+        return self.speed < self.hold_speed
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""정지한 손의 거의 같은 특징 벡터에 대한 예측 재사용(메모이제이션) 모듈"""
+import numpy as np
+
+from engine.features import NUM_FEATURES, FEATURE_DTYPE
+
+# 같은 자세로 보는 특징별 허용 오차: 각도(도) 구간과 나머지(좌표/거리/방향 벡터) 구간
+ANGLE_STEP = 2.0
+OTHER_STEP = 0.01
+
+
+class PredictionCache:
+    """
+    예측기(FlatForest / sklearn 모델)를 감싸는 LRU 확률 캐시.
+    - 특징 벡터를 특징별 허용 오차로 나눈 값을 저장하고, 새 벡터와 모든 특징의 차이가 1 이하(= 허용 오차 이내)인
+      항목이 있으면 그 확률을 재사용합니다. 고정 격자 양자화와 달리 경계 근처의 잡음에도 적중합니다.
+    - 최대 max_size 개를 유지하고 가장 오래 사용하지 않은 항목부터 교체합니다.
+    - predict / predict_proba / classes_ 를 그대로 제공하므로 예측기 자리에 바로 끼울 수 있습니다.
+    """
+    def __init__(self, predictor, max_size: int = 64,
+                 angle_step: float = ANGLE_STEP, other_step: float = OTHER_STEP,
+                 feature_index: np.ndarray = None):
+        """
+        Args:
+            predictor       : predict_proba 를 가진 예측기
+            max_size (int)  : 캐시 항목 최대 개수
+            feature_index   : 특징 선택 모델의 입력 특징 열 인덱스 (None 이면 170개 전체)
+            self.hits       : 캐시 적중 횟수
+            self.misses     : 캐시 미스(실제 예측) 횟수
+        """
+        self.predictor = predictor
+        self.classes_ = predictor.classes_
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # 특징별 허용 오차의 역수 (앞 30개: 두 손 각도)
+        inv_step = np.full(NUM_FEATURES, 1.0 / other_step, dtype=FEATURE_DTYPE)
+        inv_step[:30] = 1.0 / angle_step
+        self._inv_step = inv_step if feature_index is None else inv_step[feature_index]
+        n_features = len(self._inv_step)
+        self._scaled = np.empty(n_features, dtype=FEATURE_DTYPE)
+        self._vectors = np.empty((max_size, n_features), dtype=FEATURE_DTYPE)
+        self._diff = np.empty((max_size, n_features), dtype=FEATURE_DTYPE)
+        self._probas = [None] * max_size
+        self._last_used = np.zeros(max_size, dtype=np.int64)
+        self._count = 0
+        self._tick = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        self._count = 0
+
+    def _lookup(self) -> int:
+        """허용 오차 이내 항목의 슬롯 번호 (없으면 -1)"""
+        n = self._count
+        if n == 0:
+            return -1
+        diff = self._diff[:n]
+        np.subtract(self._vectors[:n], self._scaled, out=diff)
+        np.abs(diff, out=diff)
+        dist = diff.max(axis=1)
+        slot = int(dist.argmin())
+        return slot if dist[slot] <= 1.0 else -1
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """한 행 입력이면 캐시를 사용, 여러 행이면 그대로 예측기 호출"""
+        if X.shape[0] != 1:
+            return self.predictor.predict_proba(X)
+        self._tick += 1
+        np.multiply(X[0], self._inv_step, out=self._scaled)
+        cacheable = not np.isnan(self._scaled).any()
+        if cacheable:
+            slot = self._lookup()
+            if slot >= 0:
+                self._last_used[slot] = self._tick
+                self.hits += 1
+                return self._probas[slot]
+
+        self.misses += 1
+        proba = self.predictor.predict_proba(X)
+        if cacheable:
+            if self._count < self.max_size:
+                slot = self._count
+                self._count += 1
+            else:
+                slot = int(self._last_used.argmin())
+            self._vectors[slot] = self._scaled
+            self._probas[slot] = proba
+            self._last_used[slot] = self._tick
+        return proba
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
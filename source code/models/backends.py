@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+분류기 백엔드 목록 및 비교 모듈.
+- BACKENDS 에 이름 -> 모델 생성 함수를 등록하면 train.py --backends 로 학습/비교할 수 있습니다.
+- 백엔드마다 정확도 / F1 / 저장 파일 크기 / 로드 시간 / 단일 행 예측 지연 시간(p50, p99)을 측정하고,
+  지연 시간 예산 안에서 가장 정확한 모델을 고릅니다.
+"""
+import io
+import time
+
+import joblib
+from sklearn.ensemble import RandomForestClassifier, ExtraTreesClassifier, HistGradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.neural_network import MLPClassifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from engine.flat_forest import flatten_model
+from engine.inference import benchmark_predict, set_single_sample_mode
+
+# 이름 -> 모델 생성 함수 ('rf' 가 기존 기본 모델)
+BACKENDS = {
+    'rf':          lambda: RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1),
+    'rf_small':    lambda: RandomForestClassifier(n_estimators=30, max_depth=12, random_state=42, n_jobs=-1),
+    'rf_d16':      lambda: RandomForestClassifier(n_estimators=100, max_depth=16, random_state=42, n_jobs=-1),
+    'rf_large':    lambda: RandomForestClassifier(n_estimators=300, random_state=42, n_jobs=-1),
+    'extra_trees': lambda: ExtraTreesClassifier(n_estimators=100, random_state=42, n_jobs=-1),
+    'knn':         lambda: make_pipeline(StandardScaler(), KNeighborsClassifier(n_neighbors=5, n_jobs=-1)),
+    'logreg':      lambda: make_pipeline(StandardScaler(), LogisticRegression(max_iter=1000)),
+    'mlp':         lambda: make_pipeline(StandardScaler(),
+                                         MLPClassifier(hidden_layer_sizes=(64,), max_iter=500, random_state=42)),
+    'gbt':         lambda: HistGradientBoostingClassifier(random_state=42),
+}
+DEFAULT_BACKEND = 'rf'
+
+
+def create_backend(name: str):
+    """등록된 이름으로 학습 전 모델 생성"""
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 백엔드: {name} (사용 가능: {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
+
+def evaluate_backend(model, X_test, y_test) -> dict:
+    """
+    학습된 모델의 정확도/F1/저장 크기/로드 시간/단일 행 예측 지연 시간 측정.
+    로드 시간과 지연 시간은 실시간 인식과 같은 경로(joblib 로드 -> 평탄화 예측기) 기준입니다.
+    """
+    y_pred = model.predict(X_test)
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+    start = time.perf_counter()
+    buffer.seek(0)
+    loaded = joblib.load(buffer)
+    predictor = flatten_model(loaded) or loaded
+    load_ms = (time.perf_counter() - start) * 1000
+    latency = benchmark_predict(predictor, x=X_test[:1])
+    return {'accuracy': accuracy_score(y_test, y_pred) * 100,
+            'f1': f1_score(y_test, y_pred, average='macro'),
+            'size_kb': len(buffer.getvalue()) / 1024,
+            'load_ms': load_ms,
+            'p50': latency['p50'],
+            'p99': latency['p99']}
+
+def select_backend(names, X_train, X_test, y_train, y_test, latency_budget: float = None):
+    """
+    names 의 백엔드를 모두 학습/측정해 표를 출력하고 선택된 모델 반환.
+    - latency_budget(ms) 가 주어지면 p99 가 예산 이내인 모델 중 정확도가 가장 높은 모델 (같으면 p50 이 작은 모델)
+    - 예산을 만족하는 모델이 없으면 p99 가 가장 작은 모델
+    """
+    results = []
+    print("\n--- 백엔드 비교 ---")
+    print(f"{'백엔드':<12} | {'정확도(%)':>9} | {'F1(macro)':>9} | {'크기(KB)':>9} | "
+          f"{'로드(ms)':>8} | {'p50(ms)':>8} | {'p99(ms)':>8}")
+    for name in names:
+        model = create_backend(name)
+        model.fit(X_train, y_train)
+        # 실시간 인식은 한 프레임(1행)씩 예측하므로 병렬 디스패치 없이 저장
+        set_single_sample_mode(model)
+        r = evaluate_backend(model, X_test, y_test)
+        print(f"{name:<12} | {r['accuracy']:>9.2f} | {r['f1']:>9.4f} | {r['size_kb']:>9.0f} | "
+              f"{r['load_ms']:>8.1f} | {r['p50']:>8.3f} | {r['p99']:>8.3f}")
+        results.append((name, model, r))
+
+    within = [res for res in results if latency_budget is None or res[2]['p99'] <= latency_budget]
+    if within:
+        name, model, r = max(within, key=lambda res: (res[2]['accuracy'], -res[2]['p50']))
+    else:
+        print(f"!!! p99 {latency_budget} ms 예산을 만족하는 백엔드가 없어 가장 빠른 모델을 선택합니다 !!!")
+        name, model, r = min(results, key=lambda res: res[2]['p99'])
+    print(f"선택: {name} (정확도 {r['accuracy']:.2f}%, p99 {r['p99']:.3f} ms)")
+    return model
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+교차 검증 하이퍼파라미터 탐색 모듈.
+- 파라미터 조합 x Stratified K-fold 를 하나의 작업(trial)으로 나눠 프로세스 풀에서 병렬 실행합니다.
+- 특징 행렬은 탐색 디렉터리에 .npy 로 한 번 저장하고, 작업자는 mmap 읽기 전용으로 열어 공유합니다 (작업자별 복사 없음).
+- 끝난 trial 은 바로 trials.jsonl 에 기록하므로, 중단 후 다시 실행하면 남은 trial 만 이어서 실행합니다.
+  실패한 trial 은 기록하지 않고 건너뛰므로 다음 실행에서 다시 시도합니다.
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import ParameterGrid, StratifiedKFold
+from threadpoolctl import threadpool_limits
+
+from engine.inference import set_single_sample_mode
+from models.backends import create_backend
+
+# 백엔드별 탐색 파라미터 (Pipeline 백엔드는 '단계이름__파라미터')
+SEARCH_GRIDS = {
+    'rf':          {'n_estimators': [50, 100, 200], 'max_depth': [None, 12, 20], 'min_samples_leaf': [1, 2],
+                    'max_features': ['sqrt', 0.3]},
+    'extra_trees': {'n_estimators': [50, 100, 200], 'max_depth': [None, 12, 20], 'min_samples_leaf': [1, 2],
+                    'max_features': ['sqrt', 0.3]},
+    'knn':         {'kneighborsclassifier__n_neighbors': [1, 3, 5, 9],
+                    'kneighborsclassifier__weights': ['uniform', 'distance']},
+    'logreg':      {'logisticregression__C': [0.1, 1.0, 10.0]},
+    'mlp':         {'mlpclassifier__hidden_layer_sizes': [[32], [64], [128], [64, 32]],
+                    'mlpclassifier__alpha': [1e-4, 1e-3]},
+    'gbt':         {'learning_rate': [0.05, 0.1], 'max_depth': [None, 6], 'max_iter': [100, 200]},
+}
+
+# 작업자 프로세스의 공유 데이터 (initializer 에서 mmap 으로 엶)
+_X = None
+_y = None
+_thread_limits = None
+
+
+def _init_worker(features_path: str, labels_path: str):
+    global _X, _y, _thread_limits
+    _X = np.load(features_path, mmap_mode='r')
+    _y = np.load(labels_path, mmap_mode='r')
+    # 프로세스 단위로 병렬화하므로 OpenMP(gbt) / BLAS(logreg, mlp) 스레드 풀도 작업자당 1개로 제한
+    # (제한하지 않으면 작업자마다 코어 수만큼 스레드를 만들어 과다 구독)
+    _thread_limits = threadpool_limits(limits=1)
+
+def _run_trial(backend: str, params: dict, fold: int, train_idx: np.ndarray, test_idx: np.ndarray) -> dict:
+    """작업자에서 한 trial(파라미터 조합 1개 x fold 1개) 학습/평가"""
+    model = create_backend(backend).set_params(**params)
+    # 프로세스 단위로 병렬화하므로 모델 내부 병렬 처리는 끔
+    set_single_sample_mode(model)
+    model.fit(_X[train_idx], _y[train_idx])
+    y_pred = model.predict(_X[test_idx])
+    return {'params': params, 'fold': fold,
+            'accuracy': accuracy_score(_y[test_idx], y_pred) * 100,
+            'f1': f1_score(_y[test_idx], y_pred, average='macro')}
+
+def _trial_key(params: dict, fold: int) -> str:
+    return json.dumps(params, sort_keys=True) + f"#{fold}"
+
+def _search_id(backend: str, grid: dict, X: np.ndarray, y: np.ndarray, n_splits: int) -> str:
+    """데이터/탐색 설정 식별자 (바뀌면 이전 체크포인트를 사용하지 않음)"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({'backend': backend, 'grid': grid, 'n_splits': n_splits}, sort_keys=True).encode())
+    digest.update(np.ascontiguousarray(X).data)
+    digest.update(np.ascontiguousarray(y).data)
+    return digest.hexdigest()
+
+def _prepare_search_dir(search_dir: str, search_id: str, X: np.ndarray, y: np.ndarray):
+    """탐색 디렉터리 준비: 설정이 바뀌었으면 체크포인트를 지우고 공유 특징 파일을 다시 저장"""
+    os.makedirs(search_dir, exist_ok=True)
+    meta_path = os.path.join(search_dir, 'meta.json')
+    trials_path = os.path.join(search_dir, 'trials.jsonl')
+    features_path = os.path.join(search_dir, 'features.npy')
+    labels_path = os.path.join(search_dir, 'labels.npy')
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            same = json.load(f).get('search_id') == search_id
+    except (OSError, ValueError):
+        same = False
+    if not same or not (os.path.exists(features_path) and os.path.exists(labels_path)):
+        if os.path.exists(trials_path):
+            os.remove(trials_path)
+        np.save(features_path, np.ascontiguousarray(X))
+        np.save(labels_path, np.ascontiguousarray(y))
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'search_id': search_id}, f)
+    return features_path, labels_path, trials_path
+
+def _load_trials(trials_path: str) -> dict:
+    """체크포인트에서 끝난 trial 읽기 (중단으로 잘린 줄이 있으면 버리고 파일을 다시 씀)"""
+    done = {}
+    if not os.path.exists(trials_path):
+        return done
+    broken = False
+    with open(trials_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                trial = json.loads(line)
+            except ValueError:
+                broken = True
+                continue
+            done[_trial_key(trial['params'], trial['fold'])] = trial
+    if broken:
+        with open(trials_path, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(trial) + "\n" for trial in done.values())
+    return done
+
+def run_search(backend: str, X: np.ndarray, y: np.ndarray, search_dir: str,
+               n_splits: int = 5, n_workers: int = None) -> dict:
+    """
+    backend 의 SEARCH_GRIDS 전체 조합을 Stratified K-fold 교차 검증으로 평가.
+    결과를 평균 정확도 순으로 출력하고 가장 좋은 파라미터를 반환합니다.
+
+    Args:
+        search_dir (str) : 공유 특징 파일 / 체크포인트(trials.jsonl) 저장 디렉터리
+        n_splits (int)   : fold 수
+        n_workers (int)  : 작업자 프로세스 수 (None 이면 CPU 코어 수)
+    """
+    if backend not in SEARCH_GRIDS:
+        raise ValueError(f"탐색 파라미터가 없는 백엔드: {backend} (사용 가능: {', '.join(SEARCH_GRIDS)})")
+    grid = SEARCH_GRIDS[backend]
+    features_path, labels_path, trials_path = _prepare_search_dir(
+        search_dir, _search_id(backend, grid, X, y, n_splits), X, y)
+
+    candidates = list(ParameterGrid(grid))
+    folds = list(StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=42).split(X, y))
+    done = _load_trials(trials_path)
+    pending = [(params, fold) for params in candidates for fold in range(n_splits)
+               if _trial_key(params, fold) not in done]
+    print(f"--- 교차 검증 탐색: {backend}, 조합 {len(candidates)}개 x {n_splits}-fold "
+          f"(완료 {len(done)}개, 남은 trial {len(pending)}개) ---")
+
+    if pending:
+        with open(trials_path, 'a', encoding='utf-8') as log, \
+             ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(features_path, labels_path)) as pool:
+            futures = {pool.submit(_run_trial, backend, params, fold, *folds[fold]): (params, fold)
+                       for params, fold in pending}
+            for i, future in enumerate(as_completed(futures), 1):
+                params, fold = futures[future]
+                try:
+                    trial = future.result()
+                except Exception as e:
+                    # 실패한 trial 은 기록하지 않고 나머지 trial 을 계속 기록
+                    print(f"[{i}/{len(pending)}] fold {fold} {params}: !!! 실패: {e!r} !!!")
+                    continue
+                done[_trial_key(trial['params'], trial['fold'])] = trial
+                log.write(json.dumps(trial) + "\n")
+                log.flush()
+                print(f"[{i}/{len(pending)}] fold {trial['fold']} {trial['params']}: {trial['accuracy']:.2f}%")
+
+    # 조합별 fold 평균 (실패한 fold 가 있는 조합은 제외)
+    summary = []
+    for params in candidates:
+        keys = [_trial_key(params, fold) for fold in range(n_splits)]
+        if not all(key in done for key in keys):
+            continue
+        trials = [done[key] for key in keys]
+        acc = np.array([t['accuracy'] for t in trials])
+        f1 = np.mean([t['f1'] for t in trials])
+        summary.append((acc.mean(), acc.std(), f1, params))
+    incomplete = len(candidates) - len(summary)
+    if incomplete:
+        print(f"!!! 실패한 trial 이 있는 조합 {incomplete}개는 제외했습니다 (다시 실행하면 재시도) !!!")
+    if not summary:
+        raise RuntimeError(f"{backend}: 모든 fold 를 마친 파라미터 조합이 없습니다")
+    summary.sort(key=lambda s: s[0], reverse=True)
+    print(f"\n{'정확도(%)':>9} | {'표준편차':>7} | {'F1(macro)':>9} | 파라미터")
+    for acc, std, f1, params in summary[:10]:
+        print(f"{acc:>9.2f} | {std:>7.2f} | {f1:>9.4f} | {params}")
+    best = summary[0][3]
+    print(f"선택: {best}")
+    return best
@@ -1,62 +1,170 @@
 # -*- coding: utf-8 -*-
+import pickle
+
 import numpy as np
 from sklearn.preprocessing import LabelEncoder
-from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, f1_score
 
-from engine.features import calculate_angles, calculate_distances, calculate_orientation_vectors
+from engine.features import extract_features_batch
+from engine.dataset import load_landmark_dataset
+from engine.inference import set_single_sample_mode, benchmark_predict, model_feature_index
+from engine.flat_forest import flatten_model
+from engine.cascade import HandCascade, ROUTES, route_ids, route_features
+from engine.feature_cache import feature_cache_key, load_feature_cache, save_feature_cache
+from models.backends import create_backend, select_backend, DEFAULT_BACKEND
+from models.search import run_search
+
+def load_and_preprocess(dataset_file, cache_file=None):
+    """
+    데이터셋 로드 + 특징 추출.
+    cache_file 이 주어지면 데이터셋/특징 코드 해시가 같은 캐시를 재사용하고, 없거나 다르면 새로 만들어 저장.
+    """
+    if cache_file:
+        try:
+            cache_key = feature_cache_key(dataset_file)
+        except Exception as e:
+            print(f"데이터 파일 로드 오류: {e}")
+            return None, None, None
+        cached = load_feature_cache(cache_file, cache_key)
+        if cached is not None:
+            print(f"특징 캐시 사용: {cache_file}")
+            return cached
 
-def load_and_preprocess(dataset_file):
     print("데이터셋 로드 및 전처리 시작...")
     try:
-        labels_str = np.genfromtxt(dataset_file, delimiter=',', skip_header=1, usecols=0,
-                                   encoding="UTF-8", dtype=str)
-        landmarks_data = np.genfromtxt(dataset_file, delimiter=',', skip_header=1,
-                                       usecols=range(1, 127), encoding="UTF-8").astype(np.float32)
+        encoded_labels, label_table, landmarks_data = load_landmark_dataset(dataset_file)
     except Exception as e:
         print(f"데이터 파일 로드 오류: {e}")
         return None, None, None
 
-    all_features = []
-    for row in landmarks_data:
-        lh_landmarks = row[:63].reshape(21, 3)
-        rh_landmarks = row[63:].reshape(21, 3)
-
-        lh_angles = calculate_angles(lh_landmarks) if np.any(lh_landmarks) else np.zeros(15, dtype=np.float32)
-        rh_angles = calculate_angles(rh_landmarks) if np.any(rh_landmarks) else np.zeros(15, dtype=np.float32)
-
-        lh_coords = (lh_landmarks[1:] - lh_landmarks[0]).flatten() if np.any(lh_landmarks) else np.zeros(60, dtype=np.float32)
-        rh_coords = (rh_landmarks[1:] - rh_landmarks[0]).flatten() if np.any(rh_landmarks) else np.zeros(60, dtype=np.float32)
+    # (N, 126) -> (N, 2, 21, 3): [왼손, 오른손] 순서로 한 번에 특징 추출
+    all_features = extract_features_batch(landmarks_data.reshape(-1, 2, 21, 3))
+    # 로더가 만든 정렬된 레이블 표 = LabelEncoder.classes_ (N개 문자열을 다시 정렬하지 않음)
+    encoder = LabelEncoder()
+    encoder.classes_ = label_table
+    print("데이터 전처리 완료!")
+    if cache_file:
+        try:
+            save_feature_cache(cache_file, cache_key, all_features, encoded_labels, encoder)
+            print(f"특징 캐시 저장: {cache_file}")
+        except Exception as e:
+            print(f"특징 캐시 저장 실패: {e}")
+    return all_features, encoded_labels, encoder
 
-        lh_distances = calculate_distances(lh_landmarks) if np.any(lh_landmarks) else np.zeros(4, dtype=np.float32)
-        rh_distances = calculate_distances(rh_landmarks) if np.any(rh_landmarks) else np.zeros(4, dtype=np.float32)
+def _new_forest():
+    return create_backend(DEFAULT_BACKEND)
 
-        lh_orientation = calculate_orientation_vectors(lh_landmarks) if np.any(lh_landmarks) else np.zeros(6, dtype=np.float32)
-        rh_orientation = calculate_orientation_vectors(rh_landmarks) if np.any(rh_landmarks) else np.zeros(6, dtype=np.float32)
+def _report_cascade(cascade, monolith, X_test, y_test):
+    """
+    손 구성별 테스트 정확도 / 단일 행 예측 지연 시간을 단일 모델과 비교 출력.
+    지연 시간은 실시간 인식과 같은 평탄화 예측기(FlatForest) 기준.
+    """
+    routes = route_ids(X_test)
+    flat_monolith = flatten_model(monolith) or monolith
+    print("\n--- 손 구성별 비교 (캐스케이드 하위 모델 vs 단일 모델) ---")
+    for r, route in enumerate(ROUTES):
+        rows = routes == r
+        if route not in cascade.models or not rows.any():
+            continue
+        sub = cascade.models[route]
+        X_route = route_features(X_test[rows], route)
+        sub_acc = accuracy_score(y_test[rows], sub.predict(X_route)) * 100
+        mono_acc = accuracy_score(y_test[rows], monolith.predict(X_test[rows])) * 100
+        sub_ms = benchmark_predict(flatten_model(sub) or sub, x=X_route[:1])['p50']
+        mono_ms = benchmark_predict(flat_monolith, x=X_test[rows][:1])['p50']
+        print(f"[{route}] 클래스 {len(sub.classes_)}개, 특징 {X_route.shape[1]}개, 테스트 {int(rows.sum())}개 | "
+              f"정확도 {sub_acc:.2f}% (단일 {mono_acc:.2f}%) | p50 {sub_ms:.3f} ms (단일 {mono_ms:.3f} ms)")
 
-        features = np.concatenate([lh_angles, rh_angles, lh_coords, rh_coords,
-                                   lh_distances, rh_distances, lh_orientation, rh_orientation])
-        all_features.append(features)
+def prune_features(model, X_train, y_train, k_values, tolerance=0.5, val_size=0.2):
+    """
+    특징 중요도 기반 특징 선택.
+    - 테스트 데이터는 쓰지 않고, 학습 데이터에서 검증용(val_size)을 층화 분할해 k 를 고릅니다
+      (테스트 정확도는 최종 보고에만 사용).
+    - 검증용을 뺀 학습 데이터로 170개 전체 모델을 학습해 feature_importances_ 순위를 구하고,
+      상위 k개 특징으로 k마다 다시 학습해 검증 정확도 / F1(macro) / 모델 크기 /
+      단일 행 예측 지연 시간(평탄화 예측기 p50) 표를 출력합니다.
+    - 최고 검증 정확도에서 tolerance(%p) 이내인 가장 작은 k 를 골라 학습 데이터 전체로 다시 학습하고,
+      선택된 열 인덱스를 model.feature_index_ 로 저장합니다 (실시간 인식에서 FeatureBuilder 가 그 특징만 계산).
+    반환: 선택된 모델 (k 가 170 이면 원래 model)
+    """
+    n_features = X_train.shape[1]
+    X_fit, X_val, y_fit, y_val = train_test_split(
+        X_train, y_train, test_size=val_size, random_state=42, stratify=y_train
+    )
+    ranking = _new_forest().fit(X_fit, y_fit)
+    order = np.argsort(ranking.feature_importances_)[::-1]
+    results = []
+    print(f"\n--- 특징 선택 (중요도 상위 k개, 학습 데이터 중 검증용 {len(y_val)}개 기준) ---")
+    print(f"{'k':>5} | {'정확도(%)':>9} | {'F1(macro)':>9} | {'크기(KB)':>9} | {'p50(ms)':>8}")
+    for k in sorted({min(k, n_features) for k in k_values}):
+        index = np.sort(order[:k])
+        candidate = ranking if k == n_features else _new_forest().fit(X_fit[:, index], y_fit)
+        set_single_sample_mode(candidate)
+        y_pred = candidate.predict(X_val[:, index])
+        acc = accuracy_score(y_val, y_pred) * 100
+        f1 = f1_score(y_val, y_pred, average='macro')
+        size_kb = len(pickle.dumps(candidate)) / 1024
+        p50 = benchmark_predict(flatten_model(candidate) or candidate, x=X_val[:1, index])['p50']
+        print(f"{k:>5} | {acc:>9.2f} | {f1:>9.4f} | {size_kb:>9.0f} | {p50:>8.3f}")
+        results.append((k, index, acc))
 
-    all_features = np.array(all_features, dtype=np.float32)
-    encoder = LabelEncoder()
-    encoded_labels = encoder.fit_transform(labels_str)
-    print("데이터 전처리 완료!")
-    return all_features, encoded_labels, encoder
+    best_acc = max(acc for _, _, acc in results)
+    k, index, acc = next(r for r in results if r[2] >= best_acc - tolerance)
+    print(f"선택: 상위 {k}개 특징 (검증 정확도 {acc:.2f}%, 최고 {best_acc:.2f}%)")
+    if k == n_features:
+        return model
+    chosen = _new_forest().fit(X_train[:, index], y_train)
+    set_single_sample_mode(chosen)
+    chosen.feature_index_ = index
+    return chosen
 
-def train_model(dataset_file):
-    X, y, encoder = load_and_preprocess(dataset_file)
+def train_model(dataset_file, cache_file=None, cascade=False, prune_k=None, prune_tolerance=0.5,
+                backends=None, latency_budget=None,
+                search=None, search_dir=None, n_splits=5, n_workers=None):
+    """
+    모델 학습.
+    cascade=True 이면 손 구성(왼손만/오른손만/두 손)별 하위 모델을 묶은 HandCascade 를 학습하고,
+    같은 분할로 학습한 단일 모델과 손 구성별 정확도/지연 시간을 비교 출력합니다.
+    prune_k (k 값 목록) 가 주어지면 prune_features 로 특징을 선택한 모델을 반환합니다 (캐스케이드와 함께 사용 불가).
+    backends (백엔드 이름 목록) 가 주어지면 모두 학습/비교해 latency_budget(ms) 안에서 고른 모델을 반환합니다.
+    search (백엔드 이름) 가 주어지면 학습 데이터에서 n_splits-fold 교차 검증 탐색(search_dir 에 체크포인트)으로
+    고른 파라미터로 학습한 모델을 반환합니다.
+    """
+    X, y, encoder = load_and_preprocess(dataset_file, cache_file)
     if X is None: return None, None
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.2, random_state=42, stratify=y
     )
-    model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
-    print("--- 랜덤 포레스트 모델 학습 시작 ---")
-    model.fit(X_train, y_train)
+    if backends:
+        model = select_backend(backends, X_train, X_test, y_train, y_test, latency_budget)
+    elif search:
+        params = run_search(search, X_train, y_train, search_dir, n_splits=n_splits, n_workers=n_workers)
+        model = create_backend(search).set_params(**params)
+        print(f"--- {search} 모델 학습 시작 (탐색 결과 파라미터) ---")
+        model.fit(X_train, y_train)
+        set_single_sample_mode(model)
+    else:
+        model = _new_forest()
+        print("--- 랜덤 포레스트 모델 학습 시작 ---")
+        model.fit(X_train, y_train)
+        # 실시간 인식은 한 프레임(1행)씩 예측하므로 병렬 디스패치 없이 저장
+        set_single_sample_mode(model)
+    if cascade:
+        print("--- 손 구성별 캐스케이드 학습 시작 ---")
+        monolith = model
+        model = HandCascade.fit(X_train, y_train, _new_forest)
+        for sub in model.models.values():
+            set_single_sample_mode(sub)
+        _report_cascade(model, monolith, X_test, y_test)
+    elif prune_k:
+        model = prune_features(model, X_train, y_train, prune_k, prune_tolerance)
+    feature_index = model_feature_index(model)
+    if feature_index is not None:
+        X_test = X_test[:, feature_index]
     y_pred = model.predict(X_test)
     acc = accuracy_score(y_test, y_pred) * 100
     print(f"\n--- 학습 완료 ---\n모델 테스트 정확도: {acc:.4f}%")
-    f1 = f1_score(y_test, y_pred, average='micro')
-    print(f"f1_score: {f1:.6f}")
+    f1 = f1_score(y_test, y_pred, average='macro')
+    print(f"f1_score(macro): {f1:.6f}")
     return model, encoder
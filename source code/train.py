@@ -1,18 +1,64 @@
 """훈련 모듈: 모델 훈련 및 저장"""
 
+import argparse
 import joblib
 from pathlib import Path
-from config.paths import DATASET_FILE as dataset_file
+from config.paths import DATASET_FILE, DATASET_BIN_DIR
+from engine.dataset import is_binary_dataset, is_binary_dataset_current
 from models.train_rf import train_model
+from models.backends import BACKENDS
+from models.search import SEARCH_GRIDS
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="수어 인식 모델 훈련")
+    parser.add_argument("--dataset", default=None,
+                        help="데이터셋 경로 (CSV 파일 또는 바이너리 데이터셋 디렉터리)")
+    parser.add_argument("--cascade", action="store_true",
+                        help="손 구성(왼손만/오른손만/두 손)별 하위 모델 캐스케이드로 학습 (train_model.pkl 하나로 저장)")
+    parser.add_argument("--prune", default=None,
+                        help="특징 중요도 상위 k개로 다시 학습해 비교할 k 값 목록 (예: 20,40,60,85,120,170)")
+    parser.add_argument("--prune-tolerance", type=float, default=0.5,
+                        help="특징 선택 시 허용하는 최고 정확도 대비 정확도 감소폭 (%%p)")
+    parser.add_argument("--backends", default=None,
+                        help=f"학습/비교할 백엔드 목록 (쉼표 구분 또는 all, 사용 가능: {', '.join(BACKENDS)})")
+    parser.add_argument("--latency-budget", type=float, default=None,
+                        help="백엔드 선택 시 허용하는 단일 행 예측 p99 지연 시간 (ms)")
+    parser.add_argument("--search", default=None, choices=list(SEARCH_GRIDS),
+                        help="교차 검증 하이퍼파라미터 탐색할 백엔드 (중단 후 다시 실행하면 이어서 탐색)")
+    parser.add_argument("--folds", type=int, default=5, help="교차 검증 fold 수")
+    parser.add_argument("--workers", type=int, default=None, help="탐색 작업자 프로세스 수 (기본: CPU 코어 수)")
+    args = parser.parse_args()
+    if sum(map(bool, (args.cascade, args.prune, args.backends, args.search))) > 1:
+        parser.error("--cascade, --prune, --backends, --search 는 함께 사용할 수 없습니다")
+    backends = list(BACKENDS) if args.backends == "all" else (args.backends.split(",") if args.backends else None)
+    prune_k = [int(k) for k in args.prune.split(",")] if args.prune else None
+    # 지정하지 않으면 원본 CSV 와 같은 바이너리 데이터셋이 있을 때 우선 사용, 없거나 CSV 가 바뀌었으면 CSV
+    dataset_file = args.dataset
+    if dataset_file is None:
+        dataset_file = DATASET_FILE
+        if is_binary_dataset(DATASET_BIN_DIR):
+            if is_binary_dataset_current(DATASET_BIN_DIR):
+                dataset_file = DATASET_BIN_DIR
+            else:
+                print(f"!!! 바이너리 데이터셋({DATASET_BIN_DIR})이 현재 CSV 에서 변환된 것이 아니어서 CSV 를 사용합니다. "
+                      f"다시 변환하세요: python -m engine.dataset {DATASET_FILE} {DATASET_BIN_DIR} !!!")
+    elif is_binary_dataset(dataset_file) and not is_binary_dataset_current(dataset_file):
+        print(f"!!! 바이너리 데이터셋({dataset_file})이 현재 원본 CSV 에서 변환된 것인지 확인할 수 없습니다 (다시 변환 권장) !!!")
+
     # 모델을 저장할 디렉터리 경로 설정
     models_dir = Path("models")
     # 디렉터리 없으면 생성
     models_dir.mkdir(exist_ok = True)
     
     print("================ 모델 훈련 시작 ================")
-    model, encoder = train_model(dataset_file)
+    print(f"데이터셋: {dataset_file}")
+    # 특징 캐시: 데이터셋/특징 코드가 그대로면 전처리를 건너뜀
+    model, encoder = train_model(dataset_file, cache_file=models_dir / "feature_cache.npz",
+                                 cascade=args.cascade, prune_k=prune_k,
+                                 prune_tolerance=args.prune_tolerance,
+                                 backends=backends, latency_budget=args.latency_budget,
+                                 search=args.search, search_dir=models_dir / "search",
+                                 n_splits=args.folds, n_workers=args.workers)
     
     if model and encoder:
         try:
@@ -23,5 +69,3 @@ if __name__ == "__main__":
             print("================ 모델 저장 완료 ================")
         except Exception as e:
             print(f"!!! 모델 저장 실패: {e} !!!")
-
-
@@ -5,14 +5,25 @@ from PyQt5.QtCore import QThread, pyqtSignal
 
 from utils.camera_controller import CameraController
 from engine.gesture_recognizer import GestureRecognizer
+from engine.stabilizer import create_stabilizer
+from engine.landmark_filter import LandmarkFilter
+from ui.visualizer import resize_to_fit
 from config.settings import (CAMERA_INDEX, REQ_WIDTH, REQ_HEIGHT,
-                             REC_HISTORY_LEN, REC_COOL_TIME, DISPLAY_DURATION, SHOW_LANDMARKS, CONFIDENCE_THRESHOLD)
+                             REC_HISTORY_LEN, REC_COOL_TIME, DISPLAY_DURATION, SHOW_LANDMARKS, CONFIDENCE_THRESHOLD,
+                             REC_STABILIZER, REC_EMA_ALPHA, REC_COMMIT_MARGIN, REC_MIN_COMMIT_FRAMES,
+                             REC_CONF_LOW, REC_CONF_HIGH, REC_TRANSITION_MODE, REC_CHANGE_THRESHOLD,
+                             REC_HOLD_GATING, REC_HOLD_SPEED,
+                             REC_LANDMARK_FILTER, REC_FILTER_MIN_CUTOFF, REC_FILTER_BETA, REC_PREDICTION_CACHE,
+                             SHOW_FPS, SHOW_DEBUG_HUD, DISPLAY_SCALE_IN_THREAD)
 
 class VideoThread(QThread):
     change_pixmap_signal = pyqtSignal(np.ndarray)
+    # [벡터 오버레이] 원본 프레임 + 오버레이 항목 (GestureRecognizer.last_overlay)
+    change_frame_signal = pyqtSignal(np.ndarray, object)
     update_text_signal = pyqtSignal(str)
 
-    def __init__(self, model, encoder):
+    def __init__(self, model, encoder, vector_overlay: bool = False):
+        """vector_overlay: True 이면 오버레이를 프레임에 그리지 않고 change_frame_signal 로 함께 전송 (OpenGL 화면)"""
         super().__init__()
         self._run_flag = True
         self._is_paused = False
@@ -27,12 +38,29 @@ class VideoThread(QThread):
                                             rec_cool_time = REC_COOL_TIME,
                                             display_duration = DISPLAY_DURATION,
                                             show_landmarks = SHOW_LANDMARKS,
-                                            conf_thres = CONFIDENCE_THRESHOLD)
+                                            conf_thres = CONFIDENCE_THRESHOLD,
+                                            stabilizer = create_stabilizer(REC_STABILIZER, REC_HISTORY_LEN,
+                                                                           alpha = REC_EMA_ALPHA,
+                                                                           margin = REC_COMMIT_MARGIN,
+                                                                           min_frames = REC_MIN_COMMIT_FRAMES,
+                                                                           conf_low = REC_CONF_LOW,
+                                                                           conf_high = REC_CONF_HIGH),
+                                            transition_threshold = REC_CHANGE_THRESHOLD if REC_TRANSITION_MODE else None,
+                                            hold_speed = REC_HOLD_SPEED if REC_HOLD_GATING else None,
+                                            landmark_filter = LandmarkFilter(REC_FILTER_MIN_CUTOFF, REC_FILTER_BETA)
+                                                              if REC_LANDMARK_FILTER else None,
+                                            prediction_cache_size = REC_PREDICTION_CACHE,
+                                            show_fps = SHOW_FPS,
+                                            show_hud = SHOW_DEBUG_HUD,
+                                            vector_overlay = vector_overlay)
         
         # UI에서 직접 접근하도록 속성 연결-> UI 토글
         self.rec_cool_time = REC_COOL_TIME
         self.display_duration = DISPLAY_DURATION
         self.show_landmarks = SHOW_LANDMARKS
+        self.vector_overlay = vector_overlay
+        # 화면(camera_view) 크기: UI 가 set_display_size 로 알려주면 프레임을 여기서 맞춰 보냄
+        self._display_size = None
     
     
     # 일시정지/재개 버튼  
@@ -72,6 +100,15 @@ class VideoThread(QThread):
         self.wait()
         '''
         
+    def set_display_size(self, width: int, height: int):
+        """UI 화면 크기 변경 시 호출. DISPLAY_SCALE_IN_THREAD 이면 이 크기에 맞춘 프레임을 전송"""
+        self._display_size = (width, height) if DISPLAY_SCALE_IN_THREAD else None
+        
+    def set_vector_overlay(self, enabled: bool):
+        """오버레이를 벡터 항목으로 전달할지(OpenGL 화면) 프레임에 그릴지(QLabel 화면) 설정 -> GestureRecognizer에 전달"""
+        self.vector_overlay = enabled
+        self.recognizer.vector_overlay = enabled
+        
     def set_landmark_visibility(self, visible: bool):
         """화면에 랜드마크 표시 여부 설정 -> GestureRecognizer에 전달"""
         self.recognizer.set_show_landmarks(visible)
@@ -90,6 +127,7 @@ class VideoThread(QThread):
         - 프레임 수신 실패시 재시도
         - 인식 결과(확정 레이블) 발생시 update_text_signal 전송
         - 프레임은 change_pixmap_signal로 전송 (시각화 포함)
+          벡터 오버레이 모드면 원본 프레임 + 오버레이 항목을 change_frame_signal로 전송 (크기 조정은 화면에서 GPU 로 처리)
         """
         while self._run_flag:
             if self._is_paused:
@@ -124,6 +162,7 @@ class VideoThread(QThread):
             # 제스처 인식 및 시각화
             try:
                 out_frame, mapped_label = self.recognizer.process_frame(frame)
+                overlay = self.recognizer.last_overlay
             except Exception as e:
                 # frame이 손상되거나 recognizer 내부 에러일 때 안전 복구
                 print("!!! 프레임을 정상적으로 처리하지 못했습니다 !!! :", e)
@@ -134,7 +173,13 @@ class VideoThread(QThread):
             if mapped_label:
                 self.update_text_signal.emit(mapped_label)
             # Pixmap 갱신 시그널 전송
-            if out_frame is not None:
+            if out_frame is not None and self.vector_overlay:
+                self.change_frame_signal.emit(out_frame, overlay)
+            elif out_frame is not None:
+                # 화면 크기 맞춤은 GUI 스레드가 아닌 여기서 처리 (매 프레임 새 배열이므로 UI 에서 그대로 참조 가능)
+                display_size = self._display_size
+                if display_size is not None:
+                    out_frame = resize_to_fit(out_frame, *display_size)
                 self.change_pixmap_signal.emit(out_frame)
                 
             time.sleep(0.001)